@@ -11,7 +11,9 @@ import sys
 from rdflib import Graph, RDF, RDFS, OWL, Namespace, URIRef, Literal, BNode
 from rdflib.namespace import XSD
 import jsonschema
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from collections import defaultdict
 
 
@@ -44,6 +46,12 @@ class ABoxToJSONConverter:
         # Cache for converted objects (used in inline mode to avoid duplication)
         self._converted_cache = {}
         
+        # Checked JSON Schema validators per type, built on first validation
+        self._validators = {}
+        
+        # Types with circular references, found once for the whole schema
+        self._circular = self._find_circular_types()
+        
     def _build_type_mapping(self) -> Dict[str, str]:
         """Build a mapping from RDF class URIs to JSON schema definition names."""
         mapping = {}
@@ -331,53 +339,70 @@ class ABoxToJSONConverter:
         else:
             return uri_str
     
-    def _has_circular_reference(self, type_name: str, visited: Optional[Set[str]] = None) -> bool:
+    def _find_circular_types(self) -> frozenset:
+        """
+        Find all types that have circular references in their schema.
+        
+        A type is circular if, following its allOf references (starting with
+        the type itself), a type is reached that has a property referencing
+        itself, or the allOf references run into a cycle.
+        
+        Returns:
+            Names of the circular types
+        """
+        # allOf reference graph between definitions
+        parents = defaultdict(list)
+        out_degree = {}
+        self_referencing = []
+        for type_name, class_def in self.class_definitions.items():
+            refs = [item['$ref'].split('/')[-1] for item in class_def.get('allOf', []) if '$ref' in item]
+            out_degree[type_name] = len(refs)
+            for ref_type in refs:
+                parents[ref_type].append(type_name)
+            
+            for prop_schema in class_def.get('properties', {}).values():
+                # Check direct references and array items
+                refs = [prop_schema.get('$ref')]
+                items = prop_schema.get('items')
+                if isinstance(items, dict):
+                    refs.append(items.get('$ref'))
+                if any(ref and ref.split('/')[-1] == type_name for ref in refs):
+                    self_referencing.append(type_name)
+                    break
+        
+        # Repeatedly remove types without remaining allOf references; the
+        # types left over can reach an allOf cycle
+        removable = [name for name, degree in out_degree.items() if degree == 0]
+        removable.extend(ref_type for ref_type in parents if ref_type not in out_degree)
+        while removable:
+            for parent in parents[removable.pop()]:
+                out_degree[parent] -= 1
+                if out_degree[parent] == 0:
+                    removable.append(parent)
+        circular = {name for name, degree in out_degree.items() if degree > 0}
+        
+        # Add every type from which a self-referencing type is reachable
+        pending = [name for name in self_referencing if name not in circular]
+        circular.update(pending)
+        while pending:
+            for parent in parents[pending.pop()]:
+                if parent not in circular:
+                    circular.add(parent)
+                    pending.append(parent)
+        
+        return frozenset(circular)
+    
+    def _has_circular_reference(self, type_name: str) -> bool:
         """
         Check if a type has circular references in its schema.
         
         Args:
             type_name: The type to check
-            visited: Set of already visited types
             
         Returns:
             True if circular reference detected
         """
-        if visited is None:
-            visited = set()
-        
-        if type_name in visited:
-            return True
-        
-        if type_name not in self.class_definitions:
-            return False
-        
-        visited.add(type_name)
-        class_def = self.class_definitions[type_name]
-        
-        # Check properties for references to the same type
-        if 'properties' in class_def:
-            for prop_name, prop_schema in class_def['properties'].items():
-                # Check direct references
-                if '$ref' in prop_schema:
-                    ref_type = prop_schema['$ref'].split('/')[-1]
-                    if ref_type == type_name:
-                        return True
-                
-                # Check array items
-                if 'items' in prop_schema and '$ref' in prop_schema.get('items', {}):
-                    ref_type = prop_schema['items']['$ref'].split('/')[-1]
-                    if ref_type == type_name:
-                        return True
-        
-        # Check allOf for circular inheritance
-        if 'allOf' in class_def:
-            for item in class_def['allOf']:
-                if '$ref' in item:
-                    ref_type = item['$ref'].split('/')[-1]
-                    if self._has_circular_reference(ref_type, visited.copy()):
-                        return True
-        
-        return False
+        return type_name in self._circular
     
     def validate(self, json_instances: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """
@@ -429,18 +454,12 @@ class ABoxToJSONConverter:
                     results['total_count'] += len(instances)
                     continue
                 
-                # Create a schema for this specific type
-                type_schema = {
-                    "$schema": "http://json-schema.org/draft-07/schema#",
-                    "type": "object",
-                    "definitions": self.class_definitions,
-                    "$ref": f"#/definitions/{type_name}"
-                }
-                
                 for i, instance in enumerate(instances):
                     results['total_count'] += 1
                     try:
-                        validate(instance=instance, schema=type_schema)
+                        error = best_match(self._get_validator(type_name).iter_errors(instance))
+                        if error is not None:
+                            raise error
                         results['validated_count'] += 1
                     except RecursionError as e:
                         # This shouldn't happen with our circular reference check, but just in case
@@ -473,6 +492,31 @@ class ABoxToJSONConverter:
         
         return results
     
+    def _get_validator(self, type_name: str):
+        """
+        Get the JSON Schema validator for a type, building and checking it once.
+        
+        Args:
+            type_name: Name of the schema definition to validate against
+            
+        Returns:
+            A jsonschema validator for the type's schema
+        """
+        validator = self._validators.get(type_name)
+        if validator is None:
+            # Create a schema for this specific type
+            type_schema = {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "type": "object",
+                "definitions": self.class_definitions,
+                "$ref": f"#/definitions/{type_name}"
+            }
+            validator_class = validator_for(type_schema)
+            validator_class.check_schema(type_schema)
+            validator = validator_class(type_schema)
+            self._validators[type_name] = validator
+        return validator
+    
     def convert_and_validate(self, abox_graph: Graph) -> Dict[str, Any]:
         """
         Convert A-box to JSON and validate against schema.
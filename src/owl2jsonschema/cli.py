@@ -10,6 +10,12 @@ from .engine import TransformationEngine
 from .config import TransformationConfig
 from .parser import OntologyParser
 
+# Use the libyaml C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
@@ -93,7 +99,7 @@ def main(input_file, output_file, config_file, enable_rules, disable_rules,
         
         # Format the output
         if format == 'yaml':
-            output_str = yaml.dump(json_schema, default_flow_style=False, sort_keys=False)
+            output_str = yaml.dump(json_schema, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
         else:
             output_str = json.dumps(json_schema, indent=indent)
         
@@ -132,7 +138,7 @@ def generate_config(output_file, format):
     if format == 'json':
         Path(output_file).write_text(json.dumps(config.config, indent=2))
     else:
-        Path(output_file).write_text(yaml.dump(config.config, default_flow_style=False))
+        Path(output_file).write_text(yaml.dump(config.config, Dumper=_YamlDumper, default_flow_style=False))
     
     click.echo(f"Default configuration written to {output_file}")
 
@@ -9,6 +9,12 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+# Use the libyaml C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 
 class TransformationConfig:
     """Configuration class for the transformation engine."""
@@ -59,7 +65,7 @@ class TransformationConfig:
         
         with open(path, 'w') as f:
             if path.suffix in ['.yaml', '.yml']:
-                yaml.dump(self.config, f, default_flow_style=False)
+                yaml.dump(self.config, f, Dumper=_YamlDumper, default_flow_style=False)
             elif path.suffix == '.json':
                 json.dump(self.config, f, indent=2)
             else:
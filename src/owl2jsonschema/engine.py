@@ -14,6 +14,12 @@ from .builder import SchemaBuilder
 class TransformationEngine:
     """Main engine for transforming OWL ontologies to JSON Schema."""
     
+    # Builder created for each transformation; subclasses may substitute their own
+    builder_class = SchemaBuilder
+    
+    # Rule classes by rule ID, shared by all engines; see _get_rule_registry
+    _rule_registry: Optional[Dict[str, type]] = None
+    
     def __init__(self, config: Optional[TransformationConfig] = None):
         """
         Initialize the transformation engine.
@@ -23,38 +29,48 @@ class TransformationEngine:
         """
         self.config = config or TransformationConfig()
         self.rules: List[TransformationRule] = []
-        self.schema_builder = SchemaBuilder()
+        self.schema_builder = self.builder_class()
         self._initialize_rules()
     
+    @staticmethod
+    def _get_rule_registry() -> Dict[str, type]:
+        """
+        Get the mapping of rule IDs to rule classes, resolving it on first use.
+        
+        Returns:
+            Dictionary mapping rule IDs to rule classes
+        """
+        if TransformationEngine._rule_registry is None:
+            # Import rule implementations
+            from .rules.class_rules import ClassToObjectRule, ClassHierarchyRule, ClassRestrictionsRule
+            from .rules.property_rules import ObjectPropertyRule, DatatypePropertyRule, PropertyCardinalityRule
+            from .rules.annotation_rules import LabelsToTitlesRule, CommentsToDescriptionsRule
+            from .rules.advanced_rules import EnumerationToEnumRule, UnionToAnyOfRule, IntersectionToAllOfRule, DisjointClassesRule
+            from .rules.structural_rules import OntologyMetadataRule, ThingWithUriRule
+            
+            # Map rule IDs to rule classes
+            TransformationEngine._rule_registry = {
+                "class_to_object": ClassToObjectRule,
+                "class_hierarchy": ClassHierarchyRule,
+                "class_restrictions": ClassRestrictionsRule,  # Added this!
+                "object_property": ObjectPropertyRule,
+                "datatype_property": DatatypePropertyRule,
+                "property_cardinality": PropertyCardinalityRule,
+                "labels_to_titles": LabelsToTitlesRule,
+                "comments_to_descriptions": CommentsToDescriptionsRule,
+                "enumeration_to_enum": EnumerationToEnumRule,
+                "union_to_anyOf": UnionToAnyOfRule,
+                "intersection_to_allOf": IntersectionToAllOfRule,
+                "disjoint_classes": DisjointClassesRule,
+                "ontology_metadata": OntologyMetadataRule,
+                "thing_with_uri": ThingWithUriRule
+            }
+        return TransformationEngine._rule_registry
+    
     def _initialize_rules(self):
         """Initialize transformation rules based on configuration."""
-        # Import rule implementations
-        from .rules.class_rules import ClassToObjectRule, ClassHierarchyRule, ClassRestrictionsRule
-        from .rules.property_rules import ObjectPropertyRule, DatatypePropertyRule, PropertyCardinalityRule
-        from .rules.annotation_rules import LabelsToTitlesRule, CommentsToDescriptionsRule
-        from .rules.advanced_rules import EnumerationToEnumRule, UnionToAnyOfRule, IntersectionToAllOfRule, DisjointClassesRule
-        from .rules.structural_rules import OntologyMetadataRule, ThingWithUriRule
-        
-        # Map rule IDs to rule classes
-        rule_classes = {
-            "class_to_object": ClassToObjectRule,
-            "class_hierarchy": ClassHierarchyRule,
-            "class_restrictions": ClassRestrictionsRule,  # Added this!
-            "object_property": ObjectPropertyRule,
-            "datatype_property": DatatypePropertyRule,
-            "property_cardinality": PropertyCardinalityRule,
-            "labels_to_titles": LabelsToTitlesRule,
-            "comments_to_descriptions": CommentsToDescriptionsRule,
-            "enumeration_to_enum": EnumerationToEnumRule,
-            "union_to_anyOf": UnionToAnyOfRule,
-            "intersection_to_allOf": IntersectionToAllOfRule,
-            "disjoint_classes": DisjointClassesRule,
-            "ontology_metadata": OntologyMetadataRule,
-            "thing_with_uri": ThingWithUriRule
-        }
-        
         # Create and add rules based on configuration
-        for rule_id, rule_class in rule_classes.items():
+        for rule_id, rule_class in self._get_rule_registry().items():
             rule_config = self.config.get_rule_config(rule_id)
             rule = rule_class(rule_id, rule_config)
             self.add_rule(rule)
@@ -103,7 +119,7 @@ class TransformationEngine:
             The resulting JSON Schema
         """
         # Reset the schema builder
-        self.schema_builder = SchemaBuilder()
+        self.schema_builder = self.builder_class()
         
         # Check if ThingWithUriRule is enabled
         thing_rule = self.get_rule("thing_with_uri")
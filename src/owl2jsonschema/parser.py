@@ -4,6 +4,9 @@ Ontology Parser
 This module implements the parser for loading OWL/RDF ontologies into the object model.
 """
 
+import os
+import codecs
+import functools
 from typing import Optional, Dict, Any, List
 from rdflib import Graph, Namespace, URIRef, Literal, BNode
 from rdflib.namespace import RDF, RDFS, OWL, XSD
@@ -20,6 +23,50 @@ from .model import (
     ValueRestriction
 )
 
+# Use certifi's CA bundle for HTTPS fetches when it is installed
+try:
+    import certifi
+    _CERTIFI = certifi.where()
+except ImportError:
+    _CERTIFI = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ssl_opener() -> Optional[urllib.request.OpenerDirector]:
+    """
+    Build the URL opener used by rdflib, once per process.
+    
+    Creating the SSL context parses the system trust store and the certifi
+    bundle, so it is done on first use and then shared by all parsers.
+    
+    Returns:
+        An opener with the configured SSL context, or None if none could be created
+    """
+    try:
+        # Create a custom SSL context
+        ssl_context = ssl.create_default_context()
+        
+        # Try to use certifi for certificates
+        if _CERTIFI:
+            ssl_context.load_verify_locations(_CERTIFI)
+        
+        https_handler = urllib.request.HTTPSHandler(context=ssl_context)
+        return urllib.request.build_opener(https_handler)
+        
+    except Exception:
+        # If SSL configuration fails, try to create a more permissive context
+        # This is less secure but may work for development
+        try:
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+            
+            https_handler = urllib.request.HTTPSHandler(context=ssl_context)
+            return urllib.request.build_opener(https_handler)
+        except Exception:
+            # If all else fails, continue without custom SSL configuration
+            return None
+
 
 class OntologyParser:
     """Parser for OWL/RDF ontologies."""
@@ -609,8 +656,6 @@ class OntologyParser:
         Returns:
             Detected format string or None
         """
-        import os
-        
         # First try by extension
         ext = os.path.splitext(file_path)[1].lower()
         
@@ -634,58 +679,36 @@ class OntologyParser:
         
         # If no extension match, try to detect from content
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                # Read first few lines
-                content = f.read(1000).strip()
-                
-                # Check for common patterns
-                if content.startswith('<?xml'):
-                    return 'xml'
-                elif content.startswith('{') or content.startswith('['):
-                    return 'json-ld'
-                elif '@prefix' in content or '@base' in content:
-                    return 'turtle'
-                elif content.startswith('<') and '>' in content and not content.startswith('<?xml'):
-                    # Could be N-Triples or Turtle with URIs
-                    if '.' in content.split('\n')[0]:
-                        return 'nt'
-                    else:
-                        return 'turtle'
-        except:
-            pass
+            with open(file_path, 'rb') as f:
+                # Read the first bytes; all markers checked below are ASCII,
+                # so there is no need to decode them
+                content = f.read(1024)
+        except OSError:
+            content = b''
+        
+        if content.startswith(codecs.BOM_UTF8):
+            content = content[len(codecs.BOM_UTF8):]
+        content = content.strip()
+        
+        # Check for common patterns
+        if content.startswith(b'<?xml'):
+            return 'xml'
+        elif content.startswith((b'{', b'[')):
+            return 'json-ld'
+        elif b'@prefix' in content or b'@base' in content:
+            return 'turtle'
+        elif content.startswith(b'<') and b'>' in content:
+            # Could be N-Triples or Turtle with URIs
+            if b'.' in content.partition(b'\n')[0]:
+                return 'nt'
+            else:
+                return 'turtle'
         
         # Default to None (let rdflib guess)
         return None
     
     def _configure_ssl_for_rdflib(self):
         """Configure SSL context for rdflib's URL fetching (especially for JSON-LD contexts)."""
-        try:
-            # Create a custom SSL context
-            ssl_context = ssl.create_default_context()
-            
-            # Try to use certifi for certificates
-            try:
-                import certifi
-                ssl_context.load_verify_locations(certifi.where())
-            except ImportError:
-                pass
-            
-            # Install a custom opener with the SSL context
-            https_handler = urllib.request.HTTPSHandler(context=ssl_context)
-            opener = urllib.request.build_opener(https_handler)
+        opener = _get_ssl_opener()
+        if opener is not None:
             urllib.request.install_opener(opener)
-            
-        except Exception:
-            # If SSL configuration fails, try to create a more permissive context
-            # This is less secure but may work for development
-            try:
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                
-                https_handler = urllib.request.HTTPSHandler(context=ssl_context)
-                opener = urllib.request.build_opener(https_handler)
-                urllib.request.install_opener(opener)
-            except Exception:
-                # If all else fails, continue without custom SSL configuration
-                pass
\ No newline at end of file
@@ -2,27 +2,402 @@
 Main window for the OWL to JSON Schema GUI application with T-box/A-box workflow.
 """
 
+import os
 import sys
 import json
+import codecs
+import hashlib
+import itertools
+import tempfile
+import time
 import traceback
+from collections import OrderedDict
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+from urllib.parse import urlparse
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QFileDialog, QTextEdit,
+    QPushButton, QLabel, QFileDialog, QTextEdit, QPlainTextEdit,
     QGroupBox, QCheckBox, QScrollArea, QMessageBox,
     QTabWidget, QComboBox, QSpinBox, QLineEdit,
     QSplitter, QProgressBar, QStatusBar, QFrame, QApplication, QDialog,
-    QDialogButtonBox, QGridLayout, QRadioButton, QButtonGroup
+    QDialogButtonBox, QGridLayout, QRadioButton, QButtonGroup, QInputDialog
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QAction, QIcon, QPixmap
+from rdflib import Graph
 
 # Import the transformation engine and A-box generator
 from owl2jsonschema import TransformationEngine, TransformationConfig, OntologyParser, ABoxGenerator
 from owl2jsonschema.reasoner import ABoxValidator
-from owl2jsonschema.abox_to_json import ABoxToJSONConverter
+from owl2jsonschema.abox_to_json import ABoxToJSONConverter, JSONInstanceFormatter
+
+# requests is optional (gui extra); without it URLs are handed to rdflib directly
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    _HAS_REQUESTS = True
+except ImportError:
+    _HAS_REQUESTS = False
+
+# orjson is optional; it pretty-prints large schemas several times faster
+try:
+    import orjson
+    _HAS_ORJSON = True
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    _HAS_ORJSON = False
+
+
+# Accept header sent when downloading ontologies
+_RDF_ACCEPT = ('application/rdf+xml, text/turtle, application/ld+json, application/n-triples, '
+               'text/n3;q=0.9, application/xml;q=0.8, */*;q=0.5')
+
+# Chunk size used when streaming a downloaded ontology to disk
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Chunk size used when feeding downloaded HTML to the JSON-LD extractor
+_HTML_CHUNK_SIZE = 64 * 1024
+
+# Buffer size of files that saved JSON is streamed into
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Map of RDF media types to (rdflib format, temp file suffix)
+_FMT_TABLE = {
+    'application/ld+json': ('json-ld', '.jsonld'),
+    'application/json': ('json-ld', '.jsonld'),
+    'text/turtle': ('turtle', '.ttl'),
+    'application/x-turtle': ('turtle', '.ttl'),
+    'application/n-triples': ('nt', '.nt'),
+    'text/n3': ('n3', '.n3'),
+    'application/n3': ('n3', '.n3'),
+    'application/rdf+xml': ('xml', '.rdf'),
+    'application/xml': ('xml', '.rdf'),
+    'text/xml': ('xml', '.rdf'),
+}
+
+# URL path extension -> (rdflib format, temp file suffix), used when the
+# Content-Type is missing or generic (e.g. application/octet-stream)
+_EXT_TABLE = {
+    'ttl': ('turtle', '.ttl'),
+    'jsonld': ('json-ld', '.jsonld'),
+    'json': ('json-ld', '.jsonld'),
+    'nt': ('nt', '.nt'),
+    'n3': ('n3', '.n3'),
+    'rdf': ('xml', '.rdf'),
+    'owl': ('xml', '.rdf'),
+    'xml': ('xml', '.rdf'),
+}
+
+# File suffix -> rdflib format used when saving the A-box (Turtle otherwise)
+_ABOX_SAVE_FORMATS = {
+    '.ttl': 'turtle',
+    '.rdf': 'xml',
+    '.xml': 'xml',
+    '.nt': 'nt',
+}
+
+
+# Directory holding downloaded ontologies for conditional re-fetching
+_HTTP_CACHE_DIR = Path.home() / '.cache' / 'owl2jsonschema' / 'http'
+
+# HTTP cache entries unused for this many seconds are removed, and the oldest
+# entries are removed while the cache is larger than this many bytes
+_HTTP_CACHE_MAX_AGE = 30 * 24 * 3600
+_HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Progress messages emitted within this many seconds are sent to the GUI together,
+# up to this many per batch
+_PROGRESS_INTERVAL = 0.05
+_PROGRESS_BATCH_SIZE = 20
+
+# Number of parsed ontologies kept in memory between transformations
+_ONTOLOGY_CACHE_SIZE = 4
+
+# Shared HTTP session, created on first download
+_HTTP_SESSION = None
+
+
+def _http_session():
+    """
+    Get the shared HTTP session used for ontology downloads.
+    
+    Reusing one session keeps connections (and TLS sessions) alive between
+    transformations of the same or related URLs.
+    
+    Returns:
+        The shared requests.Session
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['Accept'] = _RDF_ACCEPT
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+def _cache_key(url: str) -> str:
+    """Get the HTTP cache file name stem for a URL."""
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def _load_cache_entry(url: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a previously downloaded copy of a URL in the HTTP cache.
+    
+    Args:
+        url: The URL of the ontology
+    
+    Returns:
+        The cache metadata (with the cached file in 'path' and the metadata
+        file in 'meta'), or None if not cached
+    """
+    key = _cache_key(url)
+    meta = _HTTP_CACHE_DIR / f"{key}.json"
+    try:
+        with open(meta, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    path = _HTTP_CACHE_DIR / f"{key}.data"
+    if entry.get('url') != url or not path.exists():
+        return None
+    entry['path'] = str(path)
+    entry['meta'] = str(meta)
+    return entry
+
+
+def _store_cache_entry(url: str, tmp_path: str, rdf_format: Optional[str],
+                       etag: Optional[str], last_modified: Optional[str]) -> str:
+    """
+    Move a downloaded file into the HTTP cache along with its validators.
+    
+    Args:
+        url: The URL the file was downloaded from
+        tmp_path: Path of the downloaded file (inside the cache directory)
+        rdf_format: The rdflib format of the file, if known
+        etag: The ETag response header
+        last_modified: The Last-Modified response header
+    
+    Returns:
+        Path of the cached file
+    """
+    key = _cache_key(url)
+    path = _HTTP_CACHE_DIR / f"{key}.data"
+    os.replace(tmp_path, path)
+    
+    entry = {
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        # The cached file has no telling suffix, so store the format the
+        # parser would pick for the default '.rdf' download suffix
+        "format": rdf_format or 'xml'
+    }
+    with open(_HTTP_CACHE_DIR / f"{key}.json", 'w', encoding='utf-8') as f:
+        json.dump(entry, f)
+    
+    _prune_http_cache(keep=key)
+    return str(path)
+
+
+def _prune_http_cache(keep: Optional[str] = None):
+    """
+    Remove stale HTTP cache entries and keep the cache within its size limit.
+    
+    Entries not used for _HTTP_CACHE_MAX_AGE seconds are removed, then the least
+    recently used ones until the cache holds at most _HTTP_CACHE_MAX_BYTES.
+    
+    Args:
+        keep: Cache key of an entry that must not be removed
+    """
+    entries = {}
+    try:
+        files = list(_HTTP_CACHE_DIR.iterdir())
+    except OSError:
+        return
+    for path in files:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        key = path.name.partition('.')[0]
+        size, mtime = entries.get(key, (0, 0.0))
+        entries[key] = (size + stat.st_size, max(mtime, stat.st_mtime))
+    
+    now = time.time()
+    total = sum(size for size, _ in entries.values())
+    for key, (size, mtime) in sorted(entries.items(), key=lambda item: item[1][1]):
+        if now - mtime <= _HTTP_CACHE_MAX_AGE and total <= _HTTP_CACHE_MAX_BYTES:
+            break
+        if key == keep:
+            continue
+        for path in files:
+            if path.name.partition('.')[0] == key:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        total -= size
+
+
+def _dumps_json(obj: Any, indent: int = 2) -> str:
+    """
+    Serialize an object to pretty-printed JSON text.
+    
+    orjson is used when it is installed and the indent is 2 (the only width
+    it supports); otherwise, or for objects orjson cannot serialize, the json
+    module is used. Unlike json.dumps, orjson does not escape non-ASCII
+    characters, so text written to files must be encoded as UTF-8.
+    
+    Args:
+        obj: The object to serialize
+        indent: Number of spaces per indentation level
+    
+    Returns:
+        The JSON text
+    """
+    if _HAS_ORJSON and indent == 2:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=indent)
+
+
+def _write_json(file_path: str, obj: Any):
+    """
+    Write an object to a file as pretty-printed UTF-8 JSON.
+    
+    With orjson the serialized bytes are written in a single call, without an
+    intermediate str. Otherwise json.dump streams into a buffered text file,
+    so the whole document is never held in memory as both str and bytes.
+    
+    Args:
+        file_path: Path of the file to write
+        obj: The object to serialize
+    """
+    if _HAS_ORJSON:
+        try:
+            data = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+        else:
+            with open(file_path, 'wb') as f:
+                f.write(data)
+            return
+    with open(file_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def _write_temp_file(chunks: Iterable[bytes], suffix: str, tmp_dir: Optional[str] = None) -> str:
+    """
+    Write chunks of data to a new temporary file.
+    
+    The file is removed again if writing fails part way (e.g. the connection
+    drops mid-download), so no partial downloads are left behind.
+    
+    Args:
+        chunks: The data to write
+        suffix: File suffix of the temporary file
+        tmp_dir: Directory to create the file in (system default if None)
+    
+    Returns:
+        Path of the written file
+    """
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=tmp_dir)
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            for chunk in chunks:
+                tmp_file.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def _file_key(path: str) -> Tuple[str, int, int]:
+    """Identify a file's current contents by its path, modification time and size."""
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def _detect_format(mime_type: str, url: Optional[str] = None) -> Tuple[Optional[str], str]:
+    """
+    Determine the RDF format of a download from its media type.
+    
+    Media types that do not identify an RDF format fall back to the extension
+    of the URL path (query string and fragment are ignored).
+    
+    Args:
+        mime_type: The lowercased Content-Type header value without parameters
+        url: The URL the ontology is downloaded from
+    
+    Returns:
+        Tuple of (rdflib format or None to auto-detect, temp file suffix)
+    """
+    detected = _FMT_TABLE.get(mime_type)
+    if detected is None and url:
+        name = urlparse(url).path.rpartition('/')[2]
+        if '.' in name:
+            detected = _EXT_TABLE.get(name.rpartition('.')[2].lower())
+    return detected or (None, '.rdf')
+
+
+class _JsonLdScriptCollector(HTMLParser):
+    """HTML parser that collects the text of <script type="application/ld+json"> elements."""
+    
+    def __init__(self):
+        super().__init__()
+        self.blocks: List[str] = []
+        self._buffer: Optional[List[str]] = None
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'script' and not self.blocks:
+            script_type = dict(attrs).get('type') or ''
+            if script_type.strip().lower() == 'application/ld+json':
+                self._buffer = []
+    
+    def handle_data(self, data):
+        if self._buffer is not None:
+            self._buffer.append(data)
+    
+    def handle_endtag(self, tag):
+        if tag == 'script' and self._buffer is not None:
+            self.blocks.append(''.join(self._buffer))
+            self._buffer = None
+
+
+def _extract_jsonld(chunks: Iterable[bytes], encoding: Optional[str] = None) -> Optional[str]:
+    """
+    Extract the first JSON-LD block embedded in an HTML document.
+    
+    The document is decoded and parsed incrementally, so large pages are never
+    held as a single decoded string.
+    
+    Args:
+        chunks: The raw HTML document as an iterable of byte chunks
+        encoding: Character encoding of the document (defaults to UTF-8)
+    
+    Returns:
+        The content of the first JSON-LD script element, or None if there is none
+    """
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    collector = _JsonLdScriptCollector()
+    for chunk in chunks:
+        collector.feed(decoder.decode(chunk))
+        if collector.blocks:
+            # Only the first block is used, so the rest of the page is not parsed
+            return collector.blocks[0]
+    collector.feed(decoder.decode(b'', final=True))
+    collector.close()
+    return collector.blocks[0] if collector.blocks else None
 
 
 class RulesConfigDialog(QDialog):
@@ -47,6 +422,16 @@ class RulesConfigDialog(QDialog):
         
     def get_default_config(self):
         """Get default configuration for all rules."""
+        return self.default_config()
+
+    @staticmethod
+    def default_config():
+        """
+        Build the default rules configuration without creating a dialog.
+        
+        Returns:
+            A fresh dictionary mapping rule IDs to their default settings
+        """
         return {
             # Class Transformations
             "class_to_object": {"enabled": True, "name": "OWL Class to JSON Object",
@@ -99,6 +484,18 @@ class RulesConfigDialog(QDialog):
                               "description": "Add a base _Thing object with 'uri' property that all classes inherit from (for RDF stream compatibility)"}
         }
     
+    @staticmethod
+    def enabled_flags():
+        """
+        Build the default enabled state of each rule.
+        
+        Returns:
+            A dictionary mapping rule IDs to {"enabled": bool}, suitable for
+            the "rules" section of a TransformationConfig
+        """
+        return {rule_id: {"enabled": settings.get("enabled", False)}
+                for rule_id, settings in RulesConfigDialog.default_config().items()}
+    
     def init_ui(self):
         """Initialize the user interface."""
         layout = QVBoxLayout()
@@ -229,9 +626,6 @@ class RulesConfigDialog(QDialog):
     
     def save_configuration(self):
         """Save the current configuration to a JSON file."""
-        from PyQt6.QtWidgets import QFileDialog
-        import json
-        
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Configuration",
@@ -269,9 +663,6 @@ class RulesConfigDialog(QDialog):
     
     def load_configuration(self):
         """Load configuration from a JSON file."""
-        from PyQt6.QtWidgets import QFileDialog
-        import json
-        
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Load Configuration",
@@ -317,12 +708,280 @@ class TransformationWorker(QThread):
     
     progress = pyqtSignal(str)
     error = pyqtSignal(str)
-    finished = pyqtSignal(dict)
+    # Result, serialized schema text and statistics text
+    finished = pyqtSignal(dict, str, str)
     
-    def __init__(self, input_source: str, config: Dict[str, Any]):
+    def __init__(self, input_source: str, config: Dict[str, Any],
+                 ontology_cache: Optional[OrderedDict] = None):
         super().__init__()
         self.input_source = input_source.strip()
         self.config = config
+        self.ontology_cache = ontology_cache
+        self._pending: List[str] = []
+        self._last_emit = 0.0
+    
+    def _emit(self, message: str, flush: bool = False):
+        """
+        Report progress, coalescing messages that follow each other closely.
+        
+        Each emit crosses the thread boundary as a queued call, so messages
+        arriving within _PROGRESS_INTERVAL of the last emit are held back and
+        sent together, one per line, in batches of at most
+        _PROGRESS_BATCH_SIZE messages.
+        
+        Args:
+            message: The progress message
+            flush: Send pending messages right away (before long-running steps
+                and for the final message)
+        """
+        self._pending.append(message)
+        now = time.monotonic()
+        if (flush or now - self._last_emit > _PROGRESS_INTERVAL
+                or len(self._pending) >= _PROGRESS_BATCH_SIZE):
+            self._flush_progress()
+            self._last_emit = now
+    
+    def _flush_progress(self):
+        """Send any pending progress messages to the GUI."""
+        if self._pending:
+            self.progress.emit('\n'.join(self._pending))
+            self._pending.clear()
+    
+    def _parse_cached(self, path: str, rdf_format: Optional[str] = None):
+        """
+        Parse an ontology file, reusing an earlier parse if the file is unchanged.
+        
+        Args:
+            path: Path to the ontology file
+            rdf_format: RDF format of the file, or None to auto-detect
+        
+        Returns:
+            The parsed ontology model
+        """
+        cache = self.ontology_cache
+        key = (_file_key(path), rdf_format)
+        if cache is not None and key in cache:
+            cache.move_to_end(key)
+            self._emit("Reusing previously parsed ontology (file unchanged)")
+            return cache[key]
+        
+        parser = OntologyParser()
+        ontology = parser.parse(path, format=rdf_format)
+        
+        if cache is not None:
+            cache[key] = ontology
+            while len(cache) > _ONTOLOGY_CACHE_SIZE:
+                cache.popitem(last=False)
+        return ontology
+    
+    def _download(self) -> Tuple[Optional[str], Optional[str], bool, Optional[str]]:
+        """
+        Download the ontology at the input URL.
+        
+        Responses carrying an ETag or Last-Modified header are kept in the HTTP
+        cache and revalidated on later downloads, so an unchanged ontology is
+        not transferred again. JSON-LD extracted from an uncached HTML page is
+        returned in memory instead of being written to disk.
+        
+        Returns:
+            Tuple of (file path or None, rdflib format or None, whether the file
+            is temporary, in-memory ontology data or None)
+        """
+        session = _http_session()
+        cache_entry = _load_cache_entry(self.input_source)
+        
+        request_headers = {}
+        if cache_entry:
+            if cache_entry.get('etag'):
+                request_headers['If-None-Match'] = cache_entry['etag']
+            if cache_entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = cache_entry['last_modified']
+        
+        try:
+            with session.get(self.input_source, headers=request_headers, verify=True,
+                             timeout=30, stream=True) as response:
+                if cache_entry and response.status_code == 304:
+                    self._emit("Served from cache (ontology not modified)")
+                    # Mark the entry as recently used for cache pruning; the
+                    # data file is left alone so its parse stays reusable
+                    try:
+                        os.utime(cache_entry['meta'])
+                    except OSError:
+                        pass
+                    return cache_entry['path'], cache_entry.get('format'), False, None
+                
+                response.raise_for_status()
+                
+                content_type = response.headers.get('Content-Type', '').lower()
+                self._emit(f"Content-Type: {content_type}")
+                
+                # Only responses that can be revalidated are worth caching
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                cacheable = bool(etag or last_modified)
+                if cacheable:
+                    try:
+                        _HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    except OSError:
+                        cacheable = False
+                tmp_dir = str(_HTTP_CACHE_DIR) if cacheable else None
+                
+                # Determine format from the headers, before any of the body is read
+                mime_type = content_type.partition(';')[0].strip()
+                is_html = 'html' in mime_type
+                rdf_format, suffix = _detect_format(mime_type, self.input_source)
+                chunk_size = _HTML_CHUNK_SIZE if is_html else _DOWNLOAD_CHUNK_SIZE
+                body = response.iter_content(chunk_size)
+                head = next(body, b'')
+                
+                sniff = head[:1024].lstrip().lower()
+                if is_html or sniff.startswith((b'<!doctype html', b'<html')):
+                    # HTML page (e.g. schema.org markup): use its embedded JSON-LD
+                    self._emit("HTML page detected, extracting embedded JSON-LD...", flush=True)
+                    encoding = response.encoding if 'charset' in content_type else None
+                    jsonld = _extract_jsonld(itertools.chain([head], body), encoding)
+                    if jsonld is None:
+                        raise ValueError("The URL returned an HTML page without embedded JSON-LD data")
+                    rdf_format = 'json-ld'
+                    suffix = '.jsonld'
+                    if not cacheable:
+                        return None, rdf_format, False, jsonld
+                    tmp_path = _write_temp_file([jsonld.encode('utf-8')], suffix, tmp_dir)
+                else:
+                    # Stream the body to disk instead of buffering it in memory
+                    self._emit("Downloading ontology...", flush=True)
+                    tmp_path = _write_temp_file(itertools.chain([head], body), suffix, tmp_dir)
+        except (requests.ConnectionError, requests.Timeout):
+            # Only network failures fall back to the cached copy; error
+            # responses from the server are reported to the user
+            if cache_entry is None:
+                raise
+            self._emit("Download failed, using cached copy of the ontology")
+            return cache_entry['path'], cache_entry.get('format'), False, None
+        
+        if cacheable:
+            path = _store_cache_entry(self.input_source, tmp_path, rdf_format, etag, last_modified)
+            return path, rdf_format, False, None
+        return tmp_path, rdf_format, True, None
+    
+    @staticmethod
+    def generate_statistics(schema: Dict) -> str:
+        """Generate transformation statistics from the schema."""
+        stats = []
+        stats.append("=" * 50)
+        stats.append("TRANSFORMATION STATISTICS")
+        stats.append("=" * 50)
+        stats.append("")
+        
+        # Count definitions
+        definitions = schema.get('definitions', {})
+        num_definitions = len(definitions)
+        stats.append(f"Total Definitions: {num_definitions}")
+        stats.append("")
+        
+        # Analyze each definition
+        class_count = 0
+        property_counts = {}
+        required_counts = {}
+        total_properties = 0
+        
+        for def_name, def_schema in definitions.items():
+            if def_schema.get('type') == 'object':
+                class_count += 1
+                
+                # Count properties
+                properties = def_schema.get('properties', {})
+                prop_count = len(properties)
+                property_counts[def_name] = prop_count
+                total_properties += prop_count
+                
+                # Count required properties
+                required = def_schema.get('required', [])
+                required_counts[def_name] = len(required)
+        
+        stats.append(f"Object Types: {class_count}")
+        stats.append(f"Total Properties: {total_properties}")
+        if class_count > 0:
+            avg_properties = total_properties / class_count
+            stats.append(f"Average Properties per Object: {avg_properties:.1f}")
+        stats.append("")
+        
+        # Detailed breakdown
+        stats.append("-" * 50)
+        stats.append("DETAILED BREAKDOWN")
+        stats.append("-" * 50)
+        stats.append("")
+        
+        for def_name in sorted(definitions.keys()):
+            def_schema = definitions[def_name]
+            stats.append(f"• {def_name}")
+            
+            # Type
+            if 'type' in def_schema:
+                stats.append(f"  Type: {def_schema['type']}")
+            
+            # Properties count
+            if def_name in property_counts:
+                stats.append(f"  Properties: {property_counts[def_name]}")
+                
+                # List property names
+                properties = def_schema.get('properties', {})
+                if properties:
+                    prop_names = sorted(properties.keys())
+                    for prop_name in prop_names:
+                        prop_schema = properties[prop_name]
+                        prop_type = prop_schema.get('type', 'unknown')
+                        if '$ref' in prop_schema:
+                            prop_type = f"ref to {prop_schema['$ref'].split('/')[-1]}"
+                        elif 'items' in prop_schema and '$ref' in prop_schema['items']:
+                            prop_type = f"array of {prop_schema['items']['$ref'].split('/')[-1]}"
+                        stats.append(f"    - {prop_name}: {prop_type}")
+            
+            # Required properties
+            if def_name in required_counts and required_counts[def_name] > 0:
+                stats.append(f"  Required Properties: {required_counts[def_name]}")
+                required = def_schema.get('required', [])
+                if required:
+                    stats.append(f"    {', '.join(required)}")
+            
+            # Enum values
+            if 'enum' in def_schema:
+                stats.append(f"  Enum Values: {len(def_schema['enum'])}")
+                stats.append(f"    {', '.join(str(v) for v in def_schema['enum'][:10])}")
+                if len(def_schema['enum']) > 10:
+                    stats.append(f"    ... and {len(def_schema['enum']) - 10} more")
+            
+            # AllOf references
+            if 'allOf' in def_schema:
+                refs = [item.get('$ref', '').split('/')[-1] for item in def_schema['allOf'] if '$ref' in item]
+                if refs:
+                    stats.append(f"  Inherits from: {', '.join(refs)}")
+            
+            stats.append("")
+        
+        # Summary
+        stats.append("-" * 50)
+        stats.append("SUMMARY")
+        stats.append("-" * 50)
+        
+        # Calculate complexity metrics
+        simple_types = sum(1 for d in definitions.values() if d.get('type') not in ['object', 'array'])
+        complex_types = num_definitions - simple_types
+        
+        stats.append(f"Simple Types: {simple_types}")
+        stats.append(f"Complex Types: {complex_types}")
+        
+        # Count inheritance relationships
+        inheritance_count = sum(1 for d in definitions.values() if 'allOf' in d)
+        if inheritance_count > 0:
+            stats.append(f"Inheritance Relationships: {inheritance_count}")
+        
+        # Count enumerations
+        enum_count = sum(1 for d in definitions.values() if 'enum' in d)
+        if enum_count > 0:
+            stats.append(f"Enumerations: {enum_count}")
+        
+        return "\n".join(stats)
     
     def run(self):
         """Run the transformation in a separate thread."""
@@ -331,71 +990,56 @@ class TransformationWorker(QThread):
             is_url = self.input_source.startswith(('http://', 'https://', 'ftp://'))
             
             if is_url:
-                self.progress.emit(f"Loading ontology from URL: {self.input_source}")
+                self._emit(f"Loading ontology from URL: {self.input_source}")
                 
-                # Try using requests library first (better SSL handling)
-                try:
-                    import requests
-                    import tempfile
-                    
-                    headers = {
-                        'Accept': 'application/rdf+xml, text/turtle, application/ld+json, application/n-triples, text/n3;q=0.9, application/xml;q=0.8, */*;q=0.5'
-                    }
-                    response = requests.get(self.input_source, headers=headers, verify=True, timeout=30)
-                    response.raise_for_status()
-                    
-                    content_type = response.headers.get('Content-Type', '').lower()
-                    self.progress.emit(f"Content-Type: {content_type}")
-                    
-                    # Determine format and save to temp file
-                    rdf_format = None
-                    suffix = '.rdf'
-                    
-                    if 'turtle' in content_type:
-                        rdf_format = 'turtle'
-                        suffix = '.ttl'
-                    elif 'json-ld' in content_type:
-                        rdf_format = 'json-ld'
-                        suffix = '.jsonld'
-                    
-                    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
-                        tmp_file.write(response.content)
-                        tmp_path = tmp_file.name
-                    
-                    self.progress.emit(f"Parsing ontology (format: {rdf_format or 'auto-detect'})...")
-                    parser = OntologyParser()
-                    ontology = parser.parse(tmp_path, format=rdf_format)
-                    
-                    # Clean up temp file
-                    import os
-                    os.unlink(tmp_path)
+                # Use requests when available (better SSL handling)
+                if _HAS_REQUESTS:
+                    tmp_path, rdf_format, is_temporary, data = self._download()
                     
-                except ImportError:
+                    try:
+                        self._emit(f"Parsing ontology (format: {rdf_format or 'auto-detect'})...", flush=True)
+                        if data is not None:
+                            parser = OntologyParser()
+                            ontology = parser.parse_string(data, format=rdf_format)
+                        elif is_temporary:
+                            parser = OntologyParser()
+                            ontology = parser.parse(tmp_path, format=rdf_format)
+                        else:
+                            ontology = self._parse_cached(tmp_path, rdf_format)
+                    finally:
+                        # Clean up temp file (cached downloads are kept)
+                        if is_temporary:
+                            os.unlink(tmp_path)
+                else:
                     # Fallback to direct parsing
-                    self.progress.emit("Attempting direct parsing...")
+                    self._emit("Attempting direct parsing...", flush=True)
                     parser = OntologyParser()
                     ontology = parser.parse(self.input_source)
             else:
-                self.progress.emit(f"Parsing ontology from file: {self.input_source}")
-                parser = OntologyParser()
-                ontology = parser.parse(self.input_source)
+                self._emit(f"Parsing ontology from file: {self.input_source}", flush=True)
+                ontology = self._parse_cached(self.input_source)
             
-            self.progress.emit(f"Parsed {len(ontology.classes)} classes, "
+            self._emit(f"Parsed {len(ontology.classes)} classes, "
                              f"{len(ontology.object_properties)} object properties, "
                              f"{len(ontology.datatype_properties)} datatype properties")
             
             # Store ontology model for A-box generation
             self.ontology_model = ontology
             
-            self.progress.emit("Running transformation...")
+            self._emit("Running transformation...", flush=True)
             config = TransformationConfig(self.config)
             engine = TransformationEngine(config)
             result = engine.transform(ontology)
             
-            self.progress.emit("Transformation completed!")
-            self.finished.emit(result)
+            # Serialize here rather than on the GUI thread
+            output_text = _dumps_json(result)
+            stats = self.generate_statistics(result)
+            
+            self._emit("Transformation completed!", flush=True)
+            self.finished.emit(result, output_text, stats)
             
         except Exception as e:
+            self._flush_progress()
             self.error.emit(f"Error during transformation: {str(e)}\n{traceback.format_exc()}")
 
 
@@ -418,6 +1062,14 @@ class MainWindow(QMainWindow):
         # Transformation rules configuration
         self.rules_config = None
         
+        # Parsed ontologies reused across transformations of unchanged inputs
+        self._ontology_cache: OrderedDict = OrderedDict()
+        
+        # Whether the JSON-LD view of the ontology needs regenerating, and the
+        # input of the completed transformation it is generated from
+        self._jsonld_stale = False
+        self._jsonld_source: Optional[str] = None
+        
         self.init_ui()
     
     def init_ui(self):
@@ -750,15 +1402,18 @@ class MainWindow(QMainWindow):
         self.owl_tabs = QTabWidget()
         
         # Original format tab
-        self.input_text = QTextEdit()
+        self.input_text = QPlainTextEdit()
         self.input_text.setFont(QFont("Consolas, 'Courier New', monospace", 11))
         self.owl_tabs.addTab(self.input_text, "Original Format")
         
         # JSON-LD format tab
-        self.jsonld_text = QTextEdit()
+        self.jsonld_text = QPlainTextEdit()
         self.jsonld_text.setFont(QFont("Consolas, 'Courier New', monospace", 11))
         self.jsonld_text.setReadOnly(True)
+        self.jsonld_text.setUndoRedoEnabled(False)
+        self.jsonld_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.owl_tabs.addTab(self.jsonld_text, "JSON-LD Format")
+        self.owl_tabs.currentChanged.connect(self.on_owl_tab_changed)
         
         owl_layout.addWidget(self.owl_tabs)
         owl_group.setLayout(owl_layout)
@@ -772,15 +1427,18 @@ class MainWindow(QMainWindow):
         self.schema_tabs = QTabWidget()
         
         # Schema tab
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setFont(QFont("Consolas, 'Courier New', monospace", 11))
         self.output_text.setReadOnly(True)
+        self.output_text.setUndoRedoEnabled(False)
+        self.output_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.schema_tabs.addTab(self.output_text, "Schema")
         
         # Statistics tab
-        self.stats_text = QTextEdit()
+        self.stats_text = QPlainTextEdit()
         self.stats_text.setFont(QFont("Consolas, 'Courier New', monospace", 11))
         self.stats_text.setReadOnly(True)
+        self.stats_text.setUndoRedoEnabled(False)
         self.schema_tabs.addTab(self.stats_text, "Statistics")
         
         schema_layout.addWidget(self.schema_tabs)
@@ -877,9 +1535,11 @@ class MainWindow(QMainWindow):
         # Output
         abox_output_group = QGroupBox("Generated A-box (RDF/OWL)")
         abox_output_layout = QVBoxLayout()
-        self.abox_output_text = QTextEdit()
+        self.abox_output_text = QPlainTextEdit()
         self.abox_output_text.setFont(QFont("Consolas, 'Courier New', monospace", 11))
         self.abox_output_text.setReadOnly(True)
+        self.abox_output_text.setUndoRedoEnabled(False)
+        self.abox_output_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         abox_output_layout.addWidget(self.abox_output_text)
         abox_output_group.setLayout(abox_output_layout)
         layout.addWidget(abox_output_group)
@@ -965,9 +1625,11 @@ class MainWindow(QMainWindow):
         # JSON output panel
         json_output_group = QGroupBox("JSON Instance")
         json_output_layout = QVBoxLayout()
-        self.json_output_text = QTextEdit()
+        self.json_output_text = QPlainTextEdit()
         self.json_output_text.setFont(QFont("Consolas, 'Courier New', monospace", 11))
         self.json_output_text.setReadOnly(True)
+        self.json_output_text.setUndoRedoEnabled(False)
+        self.json_output_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         json_output_layout.addWidget(self.json_output_text)
         json_output_group.setLayout(json_output_layout)
         output_splitter.addWidget(json_output_group)
@@ -975,9 +1637,11 @@ class MainWindow(QMainWindow):
         # JSON-LD output panel
         jsonld_output_group = QGroupBox("JSON-LD Instance")
         jsonld_output_layout = QVBoxLayout()
-        self.jsonld_output_text = QTextEdit()
+        self.jsonld_output_text = QPlainTextEdit()
         self.jsonld_output_text.setFont(QFont("Consolas, 'Courier New', monospace", 11))
         self.jsonld_output_text.setReadOnly(True)
+        self.jsonld_output_text.setUndoRedoEnabled(False)
+        self.jsonld_output_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         jsonld_output_layout.addWidget(self.jsonld_output_text)
         jsonld_output_group.setLayout(jsonld_output_layout)
         output_splitter.addWidget(jsonld_output_group)
@@ -1028,44 +1692,46 @@ class MainWindow(QMainWindow):
         """Update the status bar indicators."""
         # T-box status
         if self.tbox_ready:
-            self.tbox_status.setText("T-box: Ready ✓")
-            self.tbox_status.setStyleSheet("QLabel { color: green; font-weight: bold; }")
+            self._set_indicator(self.tbox_status, "T-box: Ready ✓", "QLabel { color: green; font-weight: bold; }")
             self.workflow_tabs.setTabEnabled(1, True)
             self.enable_abox_controls(True)
         else:
-            self.tbox_status.setText("T-box: Not Ready")
-            self.tbox_status.setStyleSheet("QLabel { color: red; font-weight: bold; }")
+            self._set_indicator(self.tbox_status, "T-box: Not Ready", "QLabel { color: red; font-weight: bold; }")
             self.workflow_tabs.setTabEnabled(1, False)
             self.workflow_tabs.setTabEnabled(2, False)
         
         # A-box status
         if self.abox_ready:
-            self.abox_status.setText("A-box: Generated ✓")
-            self.abox_status.setStyleSheet("QLabel { color: green; font-weight: bold; }")
+            self._set_indicator(self.abox_status, "A-box: Generated ✓", "QLabel { color: green; font-weight: bold; }")
             self.workflow_tabs.setTabEnabled(2, True)
             self.save_abox_action.setEnabled(True)
             self.validate_action.setEnabled(True)
             self.transform_json_btn.setEnabled(True)
         else:
-            self.abox_status.setText("A-box: Not Generated")
-            self.abox_status.setStyleSheet("QLabel { color: gray; }")
+            self._set_indicator(self.abox_status, "A-box: Not Generated", "QLabel { color: gray; }")
             self.workflow_tabs.setTabEnabled(2, False)
             self.save_abox_action.setEnabled(False)
             self.validate_action.setEnabled(False)
         
         # JSON status
         if self.json_ready:
-            self.json_status.setText("JSON: Available ✓")
-            self.json_status.setStyleSheet("QLabel { color: green; font-weight: bold; }")
+            self._set_indicator(self.json_status, "JSON: Available ✓", "QLabel { color: green; font-weight: bold; }")
             self.save_json_action.setEnabled(True)
             self.save_jsonld_action.setEnabled(True)
             self.validate_json_btn.setEnabled(True)
         else:
-            self.json_status.setText("JSON: Not Available")
-            self.json_status.setStyleSheet("QLabel { color: gray; }")
+            self._set_indicator(self.json_status, "JSON: Not Available", "QLabel { color: gray; }")
             self.save_json_action.setEnabled(False)
             self.save_jsonld_action.setEnabled(False)
     
+    def _set_indicator(self, label: QLabel, text: str, style: str):
+        """Update a status indicator, leaving it alone if nothing changed."""
+        # setStyleSheet re-polishes the label even when the sheet is identical
+        if label.text() != text:
+            label.setText(text)
+        if label.styleSheet() != style:
+            label.setStyleSheet(style)
+    
     def enable_abox_controls(self, enabled: bool):
         """Enable or disable A-box generation controls."""
         self.base_uri_input.setEnabled(enabled)
@@ -1089,6 +1755,7 @@ class MainWindow(QMainWindow):
         
         if file_path:
             self.input_file = file_path
+            self.reset_jsonld()
             self.file_label.setText(Path(file_path).name)
             self.transform_btn.setEnabled(True)
             self.save_ontology_action.setEnabled(True)  # Enable save ontology menu item
@@ -1103,8 +1770,6 @@ class MainWindow(QMainWindow):
     
     def open_url(self):
         """Open ontology from URL."""
-        from PyQt6.QtWidgets import QInputDialog
-        
         url, ok = QInputDialog.getText(
             self,
             "Open from URL",
@@ -1114,6 +1779,7 @@ class MainWindow(QMainWindow):
         
         if ok and url:
             self.input_file = url
+            self.reset_jsonld()
             self.file_label.setText(url)
             self.transform_btn.setEnabled(True)
             self.save_ontology_action.setEnabled(True)  # Enable save ontology menu item
@@ -1140,8 +1806,7 @@ class MainWindow(QMainWindow):
         
         # Get rules configuration (use defaults if not configured)
         if self.rules_config is None:
-            dialog = RulesConfigDialog(self)
-            self.rules_config = dialog.get_default_config()
+            self.rules_config = RulesConfigDialog.default_config()
             enabled_count = sum(1 for rule in self.rules_config.values() if rule.get("enabled", False))
             self.rules_status_label.setText(f"{enabled_count} of 20 rules enabled")
         
@@ -1173,7 +1838,7 @@ class MainWindow(QMainWindow):
         }
         
         # Create and start worker thread
-        self.worker = TransformationWorker(self.input_file, config)
+        self.worker = TransformationWorker(self.input_file, config, self._ontology_cache)
         self.worker.progress.connect(self.on_progress)
         self.worker.error.connect(self.on_error)
         self.worker.finished.connect(self.on_transformation_complete)
@@ -1181,7 +1846,8 @@ class MainWindow(QMainWindow):
     
     def on_progress(self, message: str):
         """Handle progress updates."""
-        self.status_message.setText(message)
+        # Closely spaced messages arrive together, one per line; show the latest
+        self.status_message.setText(message.rpartition('\n')[2])
     
     def on_error(self, error_message: str):
         """Handle transformation errors."""
@@ -1189,7 +1855,7 @@ class MainWindow(QMainWindow):
         self.transform_btn.setEnabled(True)
         QMessageBox.critical(self, "Transformation Error", error_message)
     
-    def on_transformation_complete(self, result: Dict):
+    def on_transformation_complete(self, result: Dict, output_text: str, stats: str):
         """Handle transformation completion."""
         self.transformation_result = result
         
@@ -1197,144 +1863,33 @@ class MainWindow(QMainWindow):
         if hasattr(self.worker, 'ontology_model'):
             self.ontology_model = self.worker.ontology_model
         
-        # Display result
-        output_text = json.dumps(result, indent=2)
-        self.output_text.setPlainText(output_text)
-        
-        # Generate and display statistics
-        stats = self.generate_statistics(result)
-        self.stats_text.setPlainText(stats)
-        
-        # Generate and display JSON-LD format of the ontology
-        self.generate_and_display_jsonld()
-        
-        # Update state
-        self.tbox_ready = True
-        self.update_status()
-        
-        # Update UI
-        self.progress_bar.setVisible(False)
-        self.transform_btn.setEnabled(True)
-        self.save_schema_action.setEnabled(True)  # Enable save schema action
-        self.status_message.setText("T-box transformation completed!")
-    
-    def generate_statistics(self, schema: Dict) -> str:
-        """Generate transformation statistics from the schema."""
-        stats = []
-        stats.append("=" * 50)
-        stats.append("TRANSFORMATION STATISTICS")
-        stats.append("=" * 50)
-        stats.append("")
-        
-        # Count definitions
-        definitions = schema.get('definitions', {})
-        num_definitions = len(definitions)
-        stats.append(f"Total Definitions: {num_definitions}")
-        stats.append("")
-        
-        # Analyze each definition
-        class_count = 0
-        property_counts = {}
-        required_counts = {}
-        total_properties = 0
-        
-        for def_name, def_schema in definitions.items():
-            if def_schema.get('type') == 'object':
-                class_count += 1
-                
-                # Count properties
-                properties = def_schema.get('properties', {})
-                prop_count = len(properties)
-                property_counts[def_name] = prop_count
-                total_properties += prop_count
-                
-                # Count required properties
-                required = def_schema.get('required', [])
-                required_counts[def_name] = len(required)
-        
-        stats.append(f"Object Types: {class_count}")
-        stats.append(f"Total Properties: {total_properties}")
-        if class_count > 0:
-            avg_properties = total_properties / class_count
-            stats.append(f"Average Properties per Object: {avg_properties:.1f}")
-        stats.append("")
-        
-        # Detailed breakdown
-        stats.append("-" * 50)
-        stats.append("DETAILED BREAKDOWN")
-        stats.append("-" * 50)
-        stats.append("")
-        
-        for def_name in sorted(definitions.keys()):
-            def_schema = definitions[def_name]
-            stats.append(f"• {def_name}")
-            
-            # Type
-            if 'type' in def_schema:
-                stats.append(f"  Type: {def_schema['type']}")
-            
-            # Properties count
-            if def_name in property_counts:
-                stats.append(f"  Properties: {property_counts[def_name]}")
-                
-                # List property names
-                properties = def_schema.get('properties', {})
-                if properties:
-                    prop_names = sorted(properties.keys())
-                    for prop_name in prop_names:
-                        prop_schema = properties[prop_name]
-                        prop_type = prop_schema.get('type', 'unknown')
-                        if '$ref' in prop_schema:
-                            prop_type = f"ref to {prop_schema['$ref'].split('/')[-1]}"
-                        elif 'items' in prop_schema and '$ref' in prop_schema['items']:
-                            prop_type = f"array of {prop_schema['items']['$ref'].split('/')[-1]}"
-                        stats.append(f"    - {prop_name}: {prop_type}")
+        # Apply all widget changes before the window is repainted once
+        self.setUpdatesEnabled(False)
+        try:
+            # Display result and statistics (both prepared by the worker)
+            self.output_text.setPlainText(output_text)
+            self.stats_text.setPlainText(stats)
             
-            # Required properties
-            if def_name in required_counts and required_counts[def_name] > 0:
-                stats.append(f"  Required Properties: {required_counts[def_name]}")
-                required = def_schema.get('required', [])
-                if required:
-                    stats.append(f"    {', '.join(required)}")
+            # The JSON-LD format of the ontology is generated once its tab is
+            # shown, from the input this transformation used
+            self._jsonld_stale = True
+            self._jsonld_source = self.worker.input_source
+            self.jsonld_text.clear()
+            self.save_jsonld_ontology_action.setEnabled(True)
             
-            # Enum values
-            if 'enum' in def_schema:
-                stats.append(f"  Enum Values: {len(def_schema['enum'])}")
-                stats.append(f"    {', '.join(str(v) for v in def_schema['enum'][:10])}")
-                if len(def_schema['enum']) > 10:
-                    stats.append(f"    ... and {len(def_schema['enum']) - 10} more")
-            
-            # AllOf references
-            if 'allOf' in def_schema:
-                refs = [item.get('$ref', '').split('/')[-1] for item in def_schema['allOf'] if '$ref' in item]
-                if refs:
-                    stats.append(f"  Inherits from: {', '.join(refs)}")
+            # Update state
+            self.tbox_ready = True
+            self.update_status()
             
-            stats.append("")
-        
-        # Summary
-        stats.append("-" * 50)
-        stats.append("SUMMARY")
-        stats.append("-" * 50)
-        
-        # Calculate complexity metrics
-        simple_types = sum(1 for d in definitions.values() if d.get('type') not in ['object', 'array'])
-        complex_types = num_definitions - simple_types
-        
-        stats.append(f"Simple Types: {simple_types}")
-        stats.append(f"Complex Types: {complex_types}")
-        
-        # Count inheritance relationships
-        inheritance_count = sum(1 for d in definitions.values() if 'allOf' in d)
-        if inheritance_count > 0:
-            stats.append(f"Inheritance Relationships: {inheritance_count}")
-        
-        # Count enumerations
-        enum_count = sum(1 for d in definitions.values() if 'enum' in d)
-        if enum_count > 0:
-            stats.append(f"Enumerations: {enum_count}")
+            # Update UI
+            self.progress_bar.setVisible(False)
+            self.transform_btn.setEnabled(True)
+            self.save_schema_action.setEnabled(True)  # Enable save schema action
+        finally:
+            self.setUpdatesEnabled(True)
         
-        return "\n".join(stats)
+        self.on_owl_tab_changed(self.owl_tabs.currentIndex())
+        self.status_message.setText("T-box transformation completed!")
     
     def save_schema(self):
         """Save the JSON Schema."""
@@ -1351,8 +1906,7 @@ class MainWindow(QMainWindow):
         
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    json.dump(self.transformation_result, f, indent=2)
+                _write_json(file_path, self.transformation_result)
                 QMessageBox.information(self, "Success", f"Schema saved to:\n{file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Save Error", f"Failed to save file:\n{str(e)}")
@@ -1428,14 +1982,7 @@ class MainWindow(QMainWindow):
         if file_path:
             try:
                 # Determine format from file extension
-                if file_path.endswith('.ttl'):
-                    format = 'turtle'
-                elif file_path.endswith('.rdf') or file_path.endswith('.xml'):
-                    format = 'xml'
-                elif file_path.endswith('.nt'):
-                    format = 'nt'
-                else:
-                    format = 'turtle'  # Default
+                format = _ABOX_SAVE_FORMATS.get(Path(file_path).suffix.lower(), 'turtle')
                 
                 # Serialize and save
                 content = self.abox_data.serialize(format=format)
@@ -1463,10 +2010,7 @@ class MainWindow(QMainWindow):
             try:
                 # Get the regular JSON instances (not JSON-LD)
                 json_data = self.json_instances.get('instances', self.json_instances)
-                content = json.dumps(json_data, indent=2)
-                
-                with open(file_path, 'w') as f:
-                    f.write(content)
+                _write_json(file_path, json_data)
                 
                 QMessageBox.information(self, "Success", f"JSON instances saved to:\n{file_path}")
             except Exception as e:
@@ -1489,10 +2033,7 @@ class MainWindow(QMainWindow):
             try:
                 # Get the JSON-LD version
                 jsonld_data = self.json_instances.get('jsonld', self.json_instances)
-                content = json.dumps(jsonld_data, indent=2)
-                
-                with open(file_path, 'w') as f:
-                    f.write(content)
+                _write_json(file_path, jsonld_data)
                 
                 QMessageBox.information(self, "Success", f"JSON-LD instances saved to:\n{file_path}")
             except Exception as e:
@@ -1539,9 +2080,15 @@ class MainWindow(QMainWindow):
                 'jsonld': jsonld_instances
             }
             
-            # Display in separate output panels
-            self.json_output_text.setPlainText(json.dumps(json_instances, indent=2))
-            self.jsonld_output_text.setPlainText(json.dumps(jsonld_instances, indent=2))
+            # Display in separate output panels, repainting once
+            json_text = _dumps_json(json_instances)
+            jsonld_text = _dumps_json(jsonld_instances)
+            self.json_widget.setUpdatesEnabled(False)
+            try:
+                self.json_output_text.setPlainText(json_text)
+                self.jsonld_output_text.setPlainText(jsonld_text)
+            finally:
+                self.json_widget.setUpdatesEnabled(True)
             
             # Update state
             self.json_ready = True
@@ -1617,7 +2164,6 @@ class MainWindow(QMainWindow):
                 self.json_validation_status.setStyleSheet("color: red; font-weight: bold;")
                 
                 # Format error report using the JSONInstanceFormatter
-                from owl2jsonschema.abox_to_json import JSONInstanceFormatter
                 formatter = JSONInstanceFormatter()
                 error_report = formatter.generate_validation_report(validation_results)
                 
@@ -1809,8 +2355,6 @@ class MainWindow(QMainWindow):
             return
         
         # Create format selection dialog
-        from PyQt6.QtWidgets import QInputDialog
-        
         formats = [
             "RDF/XML (.rdf, .owl)",
             "Turtle (.ttl)",
@@ -1874,8 +2418,6 @@ class MainWindow(QMainWindow):
         
         try:
             # Parse the ontology if not already parsed
-            from rdflib import Graph
-            
             self.status_message.setText("Loading ontology for conversion...")
             QApplication.processEvents()
             
@@ -1919,11 +2461,27 @@ class MainWindow(QMainWindow):
                 f"Failed to save ontology:\n\n{str(e)}"
             )
     
+    def on_owl_tab_changed(self, index: int):
+        """Generate the JSON-LD format of the ontology when its tab is shown."""
+        if self.owl_tabs.widget(index) is self.jsonld_text:
+            self.ensure_jsonld()
+    
+    def reset_jsonld(self):
+        """Discard the JSON-LD view of the ontology when the input changes."""
+        self._jsonld_stale = False
+        self._jsonld_source = None
+        self.jsonld_text.clear()
+        self.save_jsonld_ontology_action.setEnabled(False)
+    
+    def ensure_jsonld(self):
+        """Generate the JSON-LD format of the ontology if it is out of date."""
+        if self._jsonld_stale:
+            self._jsonld_stale = False
+            self.generate_and_display_jsonld()
+    
     def generate_and_display_jsonld(self):
         """Generate and display the JSON-LD version of the ontology."""
         try:
-            from rdflib import Graph
-            
             # Update status
             self.status_message.setText("Converting ontology to JSON-LD...")
             QApplication.processEvents()
@@ -1931,13 +2489,13 @@ class MainWindow(QMainWindow):
             # Create a new graph and parse the ontology
             g = Graph()
             
-            if self.input_file:
-                if self.input_file.startswith(('http://', 'https://')):
+            if self._jsonld_source:
+                if self._jsonld_source.startswith(('http://', 'https://')):
                     # Load from URL
-                    g.parse(self.input_file)
+                    g.parse(self._jsonld_source)
                 else:
                     # Load from file
-                    g.parse(self.input_file)
+                    g.parse(self._jsonld_source)
                 
                 # Serialize to JSON-LD
                 jsonld_content = g.serialize(format='json-ld')
@@ -1948,7 +2506,7 @@ class MainWindow(QMainWindow):
                 
                 # Parse and pretty-print the JSON
                 jsonld_obj = json.loads(jsonld_content)
-                jsonld_pretty = json.dumps(jsonld_obj, indent=2)
+                jsonld_pretty = _dumps_json(jsonld_obj)
                 
                 # Display in the JSON-LD tab
                 self.jsonld_text.setPlainText(jsonld_pretty)
@@ -1966,6 +2524,8 @@ class MainWindow(QMainWindow):
     
     def save_ontology_jsonld(self):
         """Save the ontology in JSON-LD format."""
+        self.ensure_jsonld()
+        
         # Get the content from the JSON-LD tab
         jsonld_content = self.jsonld_text.toPlainText()
         
@@ -1973,10 +2533,10 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "No JSON-LD content to save. Please transform the T-box first.")
             return
         
-        # Suggest a file name based on the input file
+        # Suggest a file name based on the transformed input file
         suggested_name = "ontology.jsonld"
-        if self.input_file and not self.input_file.startswith(('http://', 'https://')):
-            base_name = Path(self.input_file).stem
+        if self._jsonld_source and not self._jsonld_source.startswith(('http://', 'https://')):
+            base_name = Path(self._jsonld_source).stem
             suggested_name = f"{base_name}.jsonld"
         
         file_path, _ = QFileDialog.getSaveFileName(
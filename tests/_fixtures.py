@@ -0,0 +1,171 @@
+"""
+Shared helpers for the test scripts.
+"""
+
+import functools
+import json
+import os
+import weakref
+from pathlib import Path
+
+from owl2jsonschema import OntologyParser
+
+# orjson is optional; fall back to the standard library when it is missing
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Railway ontology shared by most of the verification scripts
+TEST_ONTOLOGY = Path("Documentation/test ontology for OWL to JSON schema transformation.ttl")
+
+
+@functools.lru_cache(maxsize=8)
+def parsed_ontology(path_str, mtime_ns):
+    """Parse an ontology file, memoized on its path and modification time.
+
+    Args:
+        path_str: Path to the ontology file.
+        mtime_ns: Modification time of the file, used to invalidate the cache.
+
+    Returns:
+        The parsed Ontology object.
+    """
+    return OntologyParser().parse(path_str)
+
+
+def load(path):
+    """Load an ontology, reusing the parse from earlier calls in this process.
+
+    Args:
+        path: Path to the ontology file.
+
+    Returns:
+        The parsed Ontology object.
+    """
+    path = Path(path)
+    return parsed_ontology(str(path), os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4096)
+def local_name(uri):
+    """Return the part of a URI after its last '#', or the URI itself.
+
+    Args:
+        uri: The URI to shorten.
+
+    Returns:
+        The local name of the URI.
+    """
+    _, sep, tail = uri.rpartition('#')
+    return tail if sep else uri
+
+
+# Class indexes keyed by ontology id, each paired with a weak reference to its
+# ontology; see classes_by_name
+_class_indexes = {}
+
+
+def classes_by_name(ontology):
+    """Index an ontology's classes by the local name of their URI.
+
+    The index is built once per ontology object and reused on later calls.
+    Ontology models are unhashable dataclasses, so indexes are keyed by id and
+    dropped through a weak reference callback once the ontology is collected.
+
+    Args:
+        ontology: A parsed Ontology object.
+
+    Returns:
+        Dictionary mapping local names to OntologyClass objects.
+    """
+    key = id(ontology)
+    cached = _class_indexes.get(key)
+    if cached is not None and cached[0]() is ontology:
+        return cached[1]
+    index = {local_name(owl_class.uri): owl_class for owl_class in ontology.classes}
+    ref = weakref.ref(ontology, lambda _, key=key: _class_indexes.pop(key, None))
+    _class_indexes[key] = (ref, index)
+    return index
+
+
+def schema_parts(schema):
+    """Yield the parts of a schema definition that can declare properties.
+
+    These are the definition itself and the dictionaries directly in its
+    ``allOf`` list. Nested ``allOf`` lists are not followed.
+
+    Args:
+        schema: A class definition from a generated JSON Schema.
+
+    Yields:
+        Tuples of a location label (``"direct properties"`` or
+        ``"allOf[i].properties"``) and the part.
+    """
+    yield "direct properties", schema
+    for i, item in enumerate(schema.get("allOf", [])):
+        if isinstance(item, dict):
+            yield f"allOf[{i}].properties", item
+
+
+def collect(schema):
+    """Merge the properties and required names of a schema's parts.
+
+    Args:
+        schema: A class definition from a generated JSON Schema.
+
+    Returns:
+        Tuple of a dict of property names to property schemas and an
+        insertion-ordered set of required property names (a dict with ``None``
+        values), so membership tests are constant time and duplicates from
+        ``allOf`` items collapse while declaration order is kept.
+    """
+    properties = {}
+    required = {}
+    for _, part in schema_parts(schema):
+        properties.update(part.get("properties", {}))
+        required.update(dict.fromkeys(part.get("required", [])))
+    return properties, required
+
+
+def json_prefix(obj, limit=1000):
+    """Pretty-print obj as JSON, stopping once limit characters are produced.
+
+    Args:
+        obj: The JSON-serializable object to print.
+        limit: Maximum number of characters to return.
+
+    Returns:
+        At most ``limit`` characters of the indented JSON text.
+    """
+    parts = []
+    size = 0
+    for chunk in json.JSONEncoder(indent=2).iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
+def write_json(path, obj):
+    """Write an object to a file as indented UTF-8 JSON.
+
+    The file is left untouched when it already holds exactly the same JSON.
+
+    Args:
+        path: Path of the file to write.
+        obj: The object to serialize.
+    """
+    path = Path(path)
+    if _HAS_ORJSON:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    path.write_bytes(data)
@@ -0,0 +1,33 @@
+"""
+Shared pytest fixtures.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from tests._fixtures import TEST_ONTOLOGY, load
+
+
+@pytest.fixture(scope="session")
+def railway_ontology():
+    """The parsed railway test ontology, shared by all tests in the session.
+
+    The parse is memoized per process by ``tests._fixtures.load``, so each
+    pytest worker process parses the file once.
+    """
+    if not TEST_ONTOLOGY.exists():
+        pytest.skip(f"Test file not found: {TEST_ONTOLOGY}")
+    return load(TEST_ONTOLOGY)
+
+
+@pytest.fixture(scope="session")
+def parsed(request):
+    """The parsed ontology for the file path given as an indirect parameter.
+
+    Each path is parsed once per session and shared by every test using it.
+    """
+    path = Path(request.param)
+    if not path.exists():
+        pytest.skip(f"Test file not found: {path}")
+    return load(path)
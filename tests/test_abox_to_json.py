@@ -3,10 +3,10 @@
 Test script for A-box to JSON conversion functionality
 """
 
-import json
 from pathlib import Path
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, Literal, URIRef
-from owl2jsonschema import TransformationEngine, TransformationConfig, OntologyParser
+from owl2jsonschema import TransformationEngine, TransformationConfig
+from tests._fixtures import json_prefix, load, write_json
 from owl2jsonschema.abox_generator import ABoxGenerator
 from owl2jsonschema.abox_to_json import ABoxToJSONConverter
 
@@ -25,8 +25,7 @@ def test_abox_to_json():
         print(f"   Warning: {ontology_path} not found, using person ontology instead")
         ontology_path = "examples/person_ontology.owl"
     
-    parser = OntologyParser()
-    ontology = parser.parse(ontology_path)
+    ontology = load(ontology_path)
     print(f"   Loaded: {len(ontology.classes)} classes, {len(ontology.object_properties)} object properties")
     
     # Step 2: Transform to JSON Schema
@@ -54,8 +53,8 @@ def test_abox_to_json():
     abox_graph = generator.generate(min_instances=2, max_instances=4)
     
     # Count individuals
-    individuals = list(abox_graph.subjects(RDF.type, None))
-    print(f"   Generated {len(individuals)} individuals")
+    n_individuals = sum(1 for _ in abox_graph.subjects(RDF.type, None))
+    print(f"   Generated {n_individuals} individuals")
     
     # Step 4: Convert A-box to JSON
     print("\n4. Converting A-box to JSON instances...")
@@ -85,7 +84,7 @@ def test_abox_to_json():
         sample = json_instances[0]
     else:
         sample = json_instances
-    print(json.dumps(sample, indent=2)[:1000])  # Show first 1000 chars
+    print(json_prefix(sample))  # Show first 1000 chars
     
     # Step 6: Generate JSON-LD
     print("\n7. Converting to JSON-LD format...")
@@ -104,10 +103,8 @@ if __name__ == "__main__":
         
         # Optional: Save results
         print("\nSaving results...")
-        with open("test_schema.json", "w") as f:
-            json.dump(schema, f, indent=2)
-        with open("test_instances.json", "w") as f:
-            json.dump(instances, f, indent=2)
+        write_json("test_schema.json", schema)
+        write_json("test_instances.json", instances)
         print("Results saved to test_schema.json and test_instances.json")
         
     except Exception as e:
@@ -4,29 +4,27 @@ Check if properties are correctly marked as optional/required.
 """
 
 import json
-from pathlib import Path
-from owl2jsonschema import TransformationEngine, TransformationConfig, OntologyParser
+from owl2jsonschema import TransformationEngine, TransformationConfig
+from tests._fixtures import TEST_ONTOLOGY, collect, load, local_name
 
 def check_required_properties():
     """Check which properties are marked as required."""
     
     # Parse the ontology
-    test_file = Path("Documentation/test ontology for OWL to JSON schema transformation.ttl")
-    parser = OntologyParser()
-    ontology = parser.parse(str(test_file))
+    ontology = load(TEST_ONTOLOGY)
     
     print("Restrictions in Ontology:")
     print("=" * 80)
     for cls in ontology.classes:
         if cls.restrictions:
-            class_name = cls.uri.split('#')[-1] if '#' in cls.uri else cls.uri
+            class_name = local_name(cls.uri)
             print(f"\n{class_name}:")
             for r in cls.restrictions:
-                prop_name = r.property_uri.split('#')[-1] if '#' in r.property_uri else r.property_uri
+                prop_name = local_name(r.property_uri)
                 print(f"  - Property: {prop_name}")
                 print(f"    Type: {r.restriction_type}")
                 if hasattr(r, 'filler'):
-                    filler_name = r.filler.split('#')[-1] if '#' in r.filler else r.filler
+                    filler_name = local_name(r.filler)
                     print(f"    Filler: {filler_name}")
     
     # Transform to JSON Schema
@@ -39,22 +37,16 @@ def check_required_properties():
     
     definitions = schema.get("definitions", {})
     
+    # Required properties per class, reused by the analysis below
+    required_by_class = {}
+    
     for class_name, class_schema in definitions.items():
         if class_name == "_Thing":
             continue
         
-        # Collect required properties
-        required_props = []
-        
-        # Check direct required
-        if "required" in class_schema:
-            required_props.extend(class_schema["required"])
-        
-        # Check required in allOf structures
-        if "allOf" in class_schema:
-            for item in class_schema["allOf"]:
-                if isinstance(item, dict) and "required" in item:
-                    required_props.extend(item["required"])
+        # Collect properties and required properties, including allOf structures
+        properties, required_props = collect(class_schema)
+        required_by_class[class_name] = required_props
         
         if required_props:
             print(f"\n{class_name}:")
@@ -62,14 +54,6 @@ def check_required_properties():
                 print(f"  - {prop} (REQUIRED)")
         else:
             # Check what properties exist but are optional
-            properties = {}
-            if "properties" in class_schema:
-                properties.update(class_schema["properties"])
-            if "allOf" in class_schema:
-                for item in class_schema["allOf"]:
-                    if isinstance(item, dict) and "properties" in item:
-                        properties.update(item["properties"])
-            
             if properties:
                 print(f"\n{class_name}:")
                 for prop in properties:
@@ -86,14 +70,7 @@ def check_required_properties():
     print("4. creationDate should be OPTIONAL (no constraint)")
     
     # Verify
-    formation_required = []
-    if "Formation" in definitions:
-        if "required" in definitions["Formation"]:
-            formation_required.extend(definitions["Formation"]["required"])
-        if "allOf" in definitions["Formation"]:
-            for item in definitions["Formation"]["allOf"]:
-                if isinstance(item, dict) and "required" in item:
-                    formation_required.extend(item["required"])
+    formation_required = required_by_class.get("Formation", {})
     
     if "composedOf" in formation_required:
         print("\n✗ ERROR: composedOf is marked as REQUIRED but should be optional")
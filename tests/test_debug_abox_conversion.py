@@ -4,12 +4,18 @@ Debug script to understand A-box to JSON conversion issues
 """
 
 import json
+from collections import defaultdict
 from pathlib import Path
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, Literal, URIRef
 from owl2jsonschema import TransformationEngine, TransformationConfig, OntologyParser
 from owl2jsonschema.abox_generator import ABoxGenerator
 from owl2jsonschema.abox_to_json import ABoxToJSONConverter
 
+def _trunc(value, limit=50):
+    """Return str(value), shortened to limit characters plus '...'."""
+    text = str(value)
+    return text[:limit] + "..." if len(text) > limit else text
+
 def debug_abox_conversion():
     """Debug the A-box to JSON conversion to see what's happening."""
     
@@ -56,11 +62,21 @@ def debug_abox_conversion():
     # Show what's actually in the RDF graph
     print("\n5. Analyzing RDF graph contents:")
     
+    # Group the triples by subject in a single pass over the graph
+    triples_by_subject = defaultdict(list)
+    typed_subjects = set()
+    class_subjects = set()
+    for s, p, o in abox_graph:
+        if not isinstance(s, URIRef):
+            continue
+        triples_by_subject[s].append((p, o))
+        if p == RDF.type:
+            typed_subjects.add(s)
+            if o == OWL.Class:
+                class_subjects.add(s)
+    
     # Find all individuals
-    individuals = set()
-    for s in abox_graph.subjects(RDF.type, None):
-        if isinstance(s, URIRef) and not ((s, RDF.type, OWL.Class) in abox_graph):
-            individuals.add(s)
+    individuals = typed_subjects - class_subjects
     
     print(f"   Found {len(individuals)} individuals")
     
@@ -68,9 +84,10 @@ def debug_abox_conversion():
     for individual in list(individuals)[:2]:  # Show first 2 individuals
         print(f"\n   Individual: {individual}")
         print("   Properties:")
-        for predicate, obj in abox_graph.predicate_objects(individual):
-            pred_name = str(predicate).split('#')[-1] if '#' in str(predicate) else str(predicate).split('/')[-1]
-            obj_str = str(obj)[:50] + "..." if len(str(obj)) > 50 else str(obj)
+        for predicate, obj in triples_by_subject[individual]:
+            pred_uri = str(predicate)
+            pred_name = pred_uri.split('#')[-1] if '#' in pred_uri else pred_uri.split('/')[-1]
+            obj_str = _trunc(obj)
             print(f"     {pred_name}: {obj_str}")
     
     # Step 4: Convert A-box to JSON
@@ -85,18 +102,22 @@ def debug_abox_conversion():
         for i, instance in enumerate(instances[:2]):  # Show first 2 instances
             print(f"   Instance {i+1}:")
             for key, value in instance.items():
-                value_str = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
+                value_str = _trunc(value)
                 print(f"     {key}: {value_str}")
     
     # Check if properties are missing
     print("\n8. Property extraction analysis:")
     missing_properties = False
+    # Expected properties per type, excluding uri, computed once
+    expected_props_by_type = {
+        type_name: set(def_schema.get('properties', {})) - {'uri'}
+        for type_name, def_schema in json_schema.get('definitions', {}).items()
+    }
     for type_name, instances in json_instances.items():
-        if type_name in json_schema.get('definitions', {}):
-            expected_props = set(json_schema['definitions'][type_name].get('properties', {}).keys())
+        if type_name in expected_props_by_type:
+            expected_props = expected_props_by_type[type_name]
             for instance in instances:
-                actual_props = set(instance.keys())
-                missing = expected_props - actual_props - {'uri'}  # Exclude uri from missing
+                missing = expected_props - instance.keys()
                 if missing:
                     print(f"   ❌ {type_name} instance missing properties: {missing}")
                     missing_properties = True
@@ -111,8 +132,7 @@ def debug_abox_conversion():
         json.dump(json_instances, f, indent=2)
     
     # Save RDF graph for inspection
-    with open("debug_abox.ttl", "w") as f:
-        f.write(abox_graph.serialize(format='turtle'))
+    abox_graph.serialize(destination="debug_abox.ttl", format='turtle', encoding='utf-8')
     
     print("\n" + "=" * 60)
     print("Debug files saved:")
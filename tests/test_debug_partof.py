@@ -23,15 +23,13 @@ def debug_partof():
     parser = OntologyParser()
     ontology = parser.parse(str(test_file))
     
-    # Find partOf property
-    partof_prop = None
-    composedof_prop = None
-    
-    for prop in ontology.object_properties:
-        if 'partOf' in prop.uri:
-            partof_prop = prop
-        if 'composedOf' in prop.uri:
-            composedof_prop = prop
+    # Index object properties by local name
+    props_by_name = {
+        prop.uri.rsplit('#', 1)[-1].rsplit('/', 1)[-1]: prop
+        for prop in ontology.object_properties
+    }
+    partof_prop = props_by_name.get('partOf')
+    composedof_prop = props_by_name.get('composedOf')
     
     if partof_prop:
         print("Found partOf property:")
@@ -65,7 +63,7 @@ def debug_partof():
     if results:
         partof_found = False
         for result in results:
-            if 'partOf' in str(result):
+            if result.get('property', {}).get('name') == 'partOf':
                 print(f"  Found partOf result: {json.dumps(result, indent=2)}")
                 partof_found = True
         if not partof_found:
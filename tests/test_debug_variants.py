@@ -3,43 +3,57 @@
 Debug script to understand why cardinality restrictions aren't marking properties as required.
 """
 
-import json
-from pathlib import Path
-from owl2jsonschema import TransformationEngine, TransformationConfig, OntologyParser
+import pytest
 from owl2jsonschema.rules.class_rules import ClassRestrictionsRule
+from tests._fixtures import classes_by_name
 
-def debug_restrictions(file_path, variant_name):
+VARIANTS = [
+    (
+        "Documentation/test ontology for OWL to JSON schema transformation, variant.ttl",
+        "Variant 1 (minCardinality/maxCardinality)"
+    ),
+    (
+        "Documentation/test ontology for OWL to JSON schema transformation, other variant.ttl",
+        "Variant 2 (minQualifiedCardinality/maxQualifiedCardinality)"
+    )
+]
+
+
+@pytest.fixture(scope="module")
+def rule():
+    """The rule keeps no state between restrictions, so one instance serves all variants."""
+    return ClassRestrictionsRule("test", {"enabled": True})
+
+
+@pytest.mark.parametrize("parsed, variant_name", VARIANTS, indirect=["parsed"],
+                         ids=["variant", "other_variant"])
+def test_debug_restrictions(parsed, variant_name, rule, monkeypatch):
     """Debug restrictions processing for a specific variant."""
     print(f"\n{'='*80}")
     print(f"Debugging {variant_name}")
-    print(f"File: {file_path}")
     print('='*80)
     
-    if not file_path.exists():
-        print(f"ERROR: File not found: {file_path}")
-        return
-    
-    # Parse the ontology
-    parser = OntologyParser()
-    ontology = parser.parse(str(file_path))
-    
     # Find Vehicle class
-    vehicle_class = None
-    for owl_class in ontology.classes:
-        if 'Vehicle' in owl_class.uri and 'VehicleType' not in owl_class.uri:
-            vehicle_class = owl_class
-            break
+    vehicle_class = classes_by_name(parsed).get('Vehicle')
     
-    if not vehicle_class:
-        print("Vehicle class not found")
-        return
+    assert vehicle_class, "Vehicle class not found"
     
     print(f"\nVehicle class found: {vehicle_class.uri}")
     print(f"Number of restrictions: {len(vehicle_class.restrictions)}")
     
-    # Process restrictions manually
-    rule = ClassRestrictionsRule("test", {"enabled": True})
+    # Results keyed by id(restriction), reused by _process_class_restrictions below
+    processed = {}
+    process_restriction = rule._process_restriction
+    
+    def cached_process_restriction(restriction):
+        key = id(restriction)
+        if key not in processed:
+            processed[key] = process_restriction(restriction)
+        return processed[key]
+    
+    monkeypatch.setattr(rule, "_process_restriction", cached_process_restriction)
     
+    # Process restrictions manually
     for i, restriction in enumerate(vehicle_class.restrictions):
         print(f"\nRestriction {i+1}:")
         print(f"  Type: {type(restriction).__name__}")
@@ -67,21 +81,5 @@ def debug_restrictions(file_path, variant_name):
         print(f"  Properties: {list(class_result.get('properties', {}).keys())}")
         print(f"  Required: {class_result.get('required', [])}")
 
-def main():
-    """Debug all three variants."""
-    variants = [
-        (
-            Path("Documentation/test ontology for OWL to JSON schema transformation, variant.ttl"),
-            "Variant 1 (minCardinality/maxCardinality)"
-        ),
-        (
-            Path("Documentation/test ontology for OWL to JSON schema transformation, other variant.ttl"),
-            "Variant 2 (minQualifiedCardinality/maxQualifiedCardinality)"
-        )
-    ]
-    
-    for file_path, variant_name in variants:
-        debug_restrictions(file_path, variant_name)
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(pytest.main([__file__, "-s"]))
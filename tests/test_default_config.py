@@ -3,31 +3,28 @@
 Test with default configuration to reproduce the missing partOf issue.
 """
 
-import json
 from pathlib import Path
-from owl2jsonschema import TransformationEngine, TransformationConfig, OntologyParser
+from owl2jsonschema import TransformationEngine, TransformationConfig
+from tests._fixtures import TEST_ONTOLOGY, collect, load, local_name, write_json
 
-def test_with_default_config():
+def test_with_default_config(railway_ontology):
     """Test with default configuration."""
     
     # Use default configuration (all rules enabled by default)
     print("Testing with default configuration (all rules enabled)")
     print("=" * 80)
     
-    # Parse the ontology
-    test_file = Path("Documentation/test ontology for OWL to JSON schema transformation.ttl")
-    parser = OntologyParser()
-    ontology = parser.parse(str(test_file))
+    ontology = railway_ontology
     
     print(f"\nObject Properties in Ontology:")
     print("-" * 40)
     for prop in ontology.object_properties:
-        prop_name = prop.uri.split('#')[-1] if '#' in prop.uri else prop.uri
-        domain = [d.split('#')[-1] for d in prop.domain] if prop.domain else []
+        prop_name = local_name(prop.uri)
+        domain = [local_name(d) for d in prop.domain] if prop.domain else []
         print(f"{prop_name}:")
         print(f"  Domain: {domain if domain else 'None (no explicit domain)'}")
         if prop.inverse_of:
-            inverse_name = prop.inverse_of.split('#')[-1] if '#' in prop.inverse_of else prop.inverse_of
+            inverse_name = local_name(prop.inverse_of)
             print(f"  Inverse: {inverse_name}")
     
     # Transform with default config
@@ -47,13 +44,7 @@ def test_with_default_config():
             continue
             
         # Collect all properties
-        properties = {}
-        if "properties" in class_schema:
-            properties.update(class_schema["properties"])
-        if "allOf" in class_schema:
-            for item in class_schema["allOf"]:
-                if isinstance(item, dict) and "properties" in item:
-                    properties.update(item["properties"])
+        properties, _ = collect(class_schema)
         
         if properties:
             print(f"\n{class_name}:")
@@ -97,9 +88,8 @@ def test_with_default_config():
     
     # Save for inspection
     output_file = Path("test_output/default_config_schema.json")
-    with open(output_file, 'w') as f:
-        json.dump(schema, f, indent=2)
+    write_json(output_file, schema)
     print(f"\nSchema saved to: {output_file}")
 
 if __name__ == "__main__":
-    test_with_default_config()
\ No newline at end of file
+    test_with_default_config(load(TEST_ONTOLOGY))
\ No newline at end of file
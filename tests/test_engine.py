@@ -12,9 +12,20 @@ from owl2jsonschema.model import (
 )
 
 
-def test_engine_initialization():
+@pytest.fixture(scope="module")
+def default_engine():
+    """Engine with the default configuration, shared by tests that do not change it.
+    
+    Sharing is safe because transform() rebuilds the schema builder and resets
+    every rule, so no output carries over between tests. Tests that enable or
+    disable rules build their own engine.
+    """
+    return TransformationEngine()
+
+
+def test_engine_initialization(default_engine):
     """Test that the engine initializes correctly."""
-    engine = TransformationEngine()
+    engine = default_engine
     assert engine is not None
     assert engine.config is not None
     assert len(engine.rules) > 0
@@ -32,17 +43,27 @@ def test_engine_with_config():
     assert engine.config == config
 
 
-def test_transform_empty_ontology():
+def test_transform_empty_ontology(default_engine):
     """Test transforming an empty ontology."""
     ontology = OntologyModel(uri="http://example.org/test")
-    engine = TransformationEngine()
-    result = engine.transform(ontology)
+    result = default_engine.transform(ontology)
     
     assert result is not None
     assert "$schema" in result
     assert result["$schema"] == "http://json-schema.org/draft-07/schema#"
 
 
+def test_transform_reflects_model_changes(default_engine):
+    """Test that re-transforming a modified ontology picks up the changes."""
+    ontology = OntologyModel(uri="http://example.org/test")
+    default_engine.transform(ontology)
+    
+    ontology.classes.append(OntologyClass(uri="http://example.org/test#Person"))
+    result = default_engine.transform(ontology)
+    
+    assert "Person" in result["definitions"]
+
+
 def test_transform_simple_class():
     """Test transforming a simple OWL class."""
     ontology = OntologyModel(uri="http://example.org/test")
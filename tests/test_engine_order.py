@@ -7,39 +7,44 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from owl2jsonschema import TransformationEngine, TransformationConfig, OntologyParser
 from owl2jsonschema.builder import SchemaBuilder
+from tests._fixtures import json_prefix
+import functools
 import json
 
-# Monkey patch the builder to log operations
-original_add_definition = SchemaBuilder.add_definition
-original_add_property_to_class = SchemaBuilder.add_property_to_class
-
-def logged_add_definition(self, name, schema):
-    print(f"[ADD_DEF] {name}")
-    if name == "RollingStock":
-        print(f"  Schema keys: {list(schema.keys())}")
-    return original_add_definition(self, name, schema)
-
-def logged_add_property_to_class(self, class_name, property_name, property_schema):
-    print(f"[ADD_PROP] {property_name} -> {class_name}")
-    clean_name = self._clean_definition_name(class_name)
-    if clean_name not in self.definitions:
-        print(f"  WARNING: Class {clean_name} not in definitions yet!")
-    return original_add_property_to_class(self, class_name, property_name, property_schema)
-
-SchemaBuilder.add_definition = logged_add_definition
-SchemaBuilder.add_property_to_class = logged_add_property_to_class
-
-# Also monkey patch engine's _process_rule_result
-from owl2jsonschema.engine import TransformationEngine as OrigEngine
-original_process = OrigEngine._process_rule_result
-
-def logged_process_rule_result(self, rule_id, result):
-    print(f"\n[RULE] Processing {rule_id}")
-    if rule_id == "disjoint_classes":
-        print(f"  Disjoint result: {json.dumps(result, indent=2)[:500]}")
-    return original_process(self, rule_id, result)
+class TracingBuilder(SchemaBuilder):
+    """Schema builder that logs definitions and properties as they are added."""
+    
+    def __init__(self, trace):
+        super().__init__()
+        self.trace = trace
+    
+    def add_definition(self, name, schema):
+        self.trace.append(f"[ADD_DEF] {name}")
+        if name == "RollingStock":
+            self.trace.append(f"  Schema keys: {list(schema.keys())}")
+        return super().add_definition(name, schema)
+    
+    def add_property_to_class(self, class_name, property_name, property_schema):
+        self.trace.append(f"[ADD_PROP] {property_name} -> {class_name}")
+        clean_name = self._clean_definition_name(class_name)
+        if clean_name not in self.definitions:
+            self.trace.append(f"  WARNING: Class {clean_name} not in definitions yet!")
+        return super().add_property_to_class(class_name, property_name, property_schema)
 
-OrigEngine._process_rule_result = logged_process_rule_result
+class TracingEngine(TransformationEngine):
+    """Engine that logs each rule result it processes."""
+    
+    def __init__(self, config, trace):
+        # Set before the base class creates its first builder
+        self.trace = trace
+        self.builder_class = functools.partial(TracingBuilder, trace)
+        super().__init__(config)
+    
+    def _process_rule_result(self, rule_id, result):
+        self.trace.append(f"\n[RULE] Processing {rule_id}")
+        if rule_id == "disjoint_classes":
+            self.trace.append(f"  Disjoint result: {json_prefix(result, 500)}")
+        return super()._process_rule_result(rule_id, result)
 
 def test_engine_order():
     """Test the order of rule processing."""
@@ -69,12 +74,17 @@ def test_engine_order():
     }
     
     config = TransformationConfig(config_dict)
-    engine = TransformationEngine(config)
+    # Trace lines are buffered and written in one go, even if a rule fails
+    trace = []
+    engine = TracingEngine(config, trace)
     
     print("Enabled rules:", engine.get_enabled_rules())
     print()
     
-    result = engine.transform(ontology)
+    try:
+        result = engine.transform(ontology)
+    finally:
+        sys.stdout.write("\n".join(trace) + "\n")
     
     print("\n" + "=" * 80)
     print("Final Result for RollingStock")
@@ -5,9 +5,35 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from owl2jsonschema import TransformationEngine, TransformationConfig, OntologyParser
+from owl2jsonschema import TransformationEngine, TransformationConfig
+from tests._fixtures import collect, load, schema_parts
 import json
 
+def _has_oneof(schema):
+    """Check whether a definition has a oneOf, directly or in an allOf item."""
+    return any("oneOf" in part for _, part in schema_parts(schema))
+
+# Checklist entries: (number, passed message, failed message, predicate).
+# Predicates take the definitions and their collect() results by name; None skips the check.
+CHECKS = [
+    (1, "partOf property exists in RollingStock", "partOf property missing in RollingStock",
+     lambda defs, index: "partOf" in index["RollingStock"][0]),
+    (2, "partOf is optional (not in required fields)", "partOf is incorrectly marked as required",
+     lambda defs, index: "partOf" not in index["RollingStock"][1]),
+    (3, "RollingStock has disjoint union (oneOf) structure", "RollingStock missing disjoint union structure",
+     lambda defs, index: _has_oneof(defs["RollingStock"])),
+] + [
+    # 4. Other properties are preserved
+    (4, f"{prop_name} exists in {class_name}", f"{prop_name} missing in {class_name}",
+     lambda defs, index, class_name=class_name, prop_name=prop_name:
+         prop_name in index[class_name][0] if class_name in index else None)
+    for class_name, prop_name in [
+        ("Formation", "composedOf"),
+        ("Vehicle", "ofType"),
+        ("LegalEntity", "creationDate")
+    ]
+]
+
 def verify_fix():
     """Verify that the fix resolves all issues."""
     
@@ -19,8 +45,7 @@ def verify_fix():
     print()
     
     # Parse ontology
-    parser = OntologyParser()
-    ontology = parser.parse(str(test_file))
+    ontology = load(test_file)
     
     # Use GUI default configuration
     config_dict = {
@@ -45,86 +70,19 @@ def verify_fix():
     print("-" * 40)
     
     checks_passed = []
+    definitions = result.get("definitions", {})
     
-    # 1. Check partOf exists in RollingStock
-    if "definitions" in result and "RollingStock" in result["definitions"]:
-        rs = result["definitions"]["RollingStock"]
-        partof_found = False
-        
-        # Check in direct properties
-        if "properties" in rs and "partOf" in rs["properties"]:
-            partof_found = True
-        
-        # Check in allOf
-        if "allOf" in rs:
-            for item in rs["allOf"]:
-                if "properties" in item and "partOf" in item["properties"]:
-                    partof_found = True
-        
-        if partof_found:
-            print("✓ 1. partOf property exists in RollingStock")
-            checks_passed.append(True)
-        else:
-            print("✗ 1. partOf property missing in RollingStock")
-            checks_passed.append(False)
-        
-        # 2. Check partOf is optional (not required)
-        required_fields = []
-        if "required" in rs:
-            required_fields.extend(rs["required"])
-        if "allOf" in rs:
-            for item in rs["allOf"]:
-                if "required" in item:
-                    required_fields.extend(item["required"])
-        
-        if "partOf" not in required_fields:
-            print("✓ 2. partOf is optional (not in required fields)")
-            checks_passed.append(True)
-        else:
-            print("✗ 2. partOf is incorrectly marked as required")
-            checks_passed.append(False)
-        
-        # 3. Check RollingStock has disjoint union structure
-        has_oneof = False
-        if "oneOf" in rs:
-            has_oneof = True
-        elif "allOf" in rs:
-            for item in rs["allOf"]:
-                if "oneOf" in item:
-                    has_oneof = True
-        
-        if has_oneof:
-            print("✓ 3. RollingStock has disjoint union (oneOf) structure")
-            checks_passed.append(True)
-        else:
-            print("✗ 3. RollingStock missing disjoint union structure")
-            checks_passed.append(False)
-        
-        # 4. Check other properties are preserved
-        other_checks = [
-            ("Formation", "composedOf"),
-            ("Vehicle", "ofType"),
-            ("LegalEntity", "creationDate")
-        ]
-        
-        for class_name, prop_name in other_checks:
-            if class_name in result["definitions"]:
-                class_def = result["definitions"][class_name]
-                prop_found = False
-                
-                if "properties" in class_def and prop_name in class_def["properties"]:
-                    prop_found = True
-                elif "allOf" in class_def:
-                    for item in class_def["allOf"]:
-                        if "properties" in item and prop_name in item["properties"]:
-                            prop_found = True
-                
-                if prop_found:
-                    print(f"✓ 4. {prop_name} exists in {class_name}")
-                    checks_passed.append(True)
-                else:
-                    print(f"✗ 4. {prop_name} missing in {class_name}")
-                    checks_passed.append(False)
+    if "RollingStock" in definitions:
+        index = {name: collect(class_schema) for name, class_schema in definitions.items()}
+        for number, passed_message, failed_message, predicate in CHECKS:
+            passed = predicate(definitions, index)
+            if passed is None:
+                continue
+            if passed:
+                print(f"✓ {number}. {passed_message}")
+            else:
+                print(f"✗ {number}. {failed_message}")
+            checks_passed.append(passed)
     
     print()
     print("=" * 80)
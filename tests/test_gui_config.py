@@ -3,17 +3,16 @@
 Test with GUI default configuration to reproduce the missing partOf issue.
 """
 
-import json
 from pathlib import Path
-from owl2jsonschema import TransformationEngine, TransformationConfig, OntologyParser
+from owl2jsonschema import TransformationEngine, TransformationConfig
+from tests._fixtures import TEST_ONTOLOGY, collect, load, local_name, write_json
 from owl2jsonschema_gui.main_window import RulesConfigDialog
 
-def test_with_default_config():
+def test_with_default_config(railway_ontology):
     """Test with the same default configuration as the GUI."""
     
-    # Get the default configuration from the GUI dialog
-    dialog = RulesConfigDialog(None)
-    default_config = dialog.get_default_config()
+    # Get the default configuration used by the GUI dialog
+    default_config = RulesConfigDialog.default_config()
     
     print("Default GUI Configuration:")
     print("=" * 80)
@@ -21,27 +20,20 @@ def test_with_default_config():
         if rule_settings.get("enabled", False):
             print(f"✓ {rule_id}: {rule_settings.get('name', rule_id)}")
     
-    # Parse the ontology
-    test_file = Path("Documentation/test ontology for OWL to JSON schema transformation.ttl")
-    parser = OntologyParser()
-    ontology = parser.parse(str(test_file))
+    ontology = railway_ontology
     
     print(f"\n\nOntology Properties:")
     print("=" * 80)
     for prop in ontology.object_properties:
-        prop_name = prop.uri.split('#')[-1] if '#' in prop.uri else prop.uri
+        prop_name = local_name(prop.uri)
         print(f"\n{prop_name}:")
         print(f"  Domain: {prop.domain}")
         print(f"  Range: {prop.range}")
         print(f"  Inverse: {prop.inverse_of}")
     
     # Build configuration matching GUI defaults
-    rules_config = {}
-    for rule_id, rule_settings in default_config.items():
-        rules_config[rule_id] = {"enabled": rule_settings.get("enabled", False)}
-    
     config = {
-        "rules": rules_config,
+        "rules": RulesConfigDialog.enabled_flags(),
         "output": {
             "include_uri": False,  # GUI default
             "use_arrays": True
@@ -56,21 +48,13 @@ def test_with_default_config():
     print("=" * 80)
     
     definitions = schema.get("definitions", {})
+    index = {name: collect(class_schema) for name, class_schema in definitions.items()}
     
     # Check each class for properties
-    for class_name, class_schema in definitions.items():
+    for class_name, (properties, _) in index.items():
         if class_name == "_Thing":
             continue
             
-        # Collect all properties
-        properties = {}
-        if "properties" in class_schema:
-            properties.update(class_schema["properties"])
-        if "allOf" in class_schema:
-            for item in class_schema["allOf"]:
-                if isinstance(item, dict) and "properties" in item:
-                    properties.update(item["properties"])
-        
         if properties:
             print(f"\n{class_name}:")
             for prop_name in properties:
@@ -81,16 +65,10 @@ def test_with_default_config():
     print("=" * 80)
     
     partof_found = False
-    for class_name, class_schema in definitions.items():
-        # Check in all levels
-        if "properties" in class_schema and "partOf" in class_schema["properties"]:
+    for class_name, (properties, _) in index.items():
+        if "partOf" in properties:
             partof_found = True
-            print(f"✓ Found in {class_name} (direct)")
-        if "allOf" in class_schema:
-            for item in class_schema["allOf"]:
-                if isinstance(item, dict) and "properties" in item and "partOf" in item["properties"]:
-                    partof_found = True
-                    print(f"✓ Found in {class_name} (in allOf)")
+            print(f"✓ Found in {class_name}")
     
     if not partof_found:
         print("✗ 'partOf' NOT FOUND in schema!")
@@ -99,9 +77,8 @@ def test_with_default_config():
     
     # Save the schema for inspection
     output_file = Path("test_output/gui_default_schema.json")
-    with open(output_file, 'w') as f:
-        json.dump(schema, f, indent=2)
+    write_json(output_file, schema)
     print(f"\nSchema saved to: {output_file}")
 
 if __name__ == "__main__":
-    test_with_default_config()
\ No newline at end of file
+    test_with_default_config(load(TEST_ONTOLOGY))
\ No newline at end of file
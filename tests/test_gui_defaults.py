@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 """Test transformation with GUI default configuration."""
 
+import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from owl2jsonschema import TransformationEngine, TransformationConfig, OntologyParser
+from owl2jsonschema import TransformationEngine, TransformationConfig
+from tests._fixtures import TEST_ONTOLOGY, load, schema_parts
 import json
 
 # Exact same default configuration as GUI
@@ -41,19 +44,34 @@ GUI_DEFAULT_CONFIG = {
     "thing_with_uri": {"enabled": True}
 }
 
-def test_with_gui_defaults():
-    """Test transformation with GUI default configuration."""
+# Full configuration matching the GUI defaults, built once and read-only
+CONFIG_DICT = MappingProxyType({
+    "rules": MappingProxyType(GUI_DEFAULT_CONFIG),
+    "output": MappingProxyType({
+        "include_uri": False,  # GUI default is unchecked
+        "use_arrays": True      # Always use arrays for multi-valued properties
+    })
+})
+
+def find_property(definitions, name):
+    """Yield (class name, location, schema) for each definition declaring a property.
     
-    test_file = Path("Documentation/test ontology for OWL to JSON schema transformation.ttl")
+    Both the direct properties and those inside allOf items are searched.
+    """
+    for class_name, class_def in definitions.items():
+        for location, part in schema_parts(class_def):
+            if name in part.get('properties', {}):
+                yield class_name, location, part['properties'][name]
+
+def test_with_gui_defaults(railway_ontology):
+    """Test transformation with GUI default configuration."""
     
     print("=" * 80)
     print("Testing with GUI Default Configuration")
     print("=" * 80)
     print()
     
-    # Parse ontology
-    parser = OntologyParser()
-    ontology = parser.parse(str(test_file))
+    ontology = railway_ontology
     
     print(f"Parsed {len(ontology.classes)} classes:")
     for cls in ontology.classes:
@@ -71,25 +89,18 @@ def test_with_gui_defaults():
             print(f"    Inverse of: {prop.inverse_of}")
     print()
     
-    # Create configuration matching GUI defaults
-    config_dict = {
-        "rules": GUI_DEFAULT_CONFIG,
-        "output": {
-            "include_uri": False,  # GUI default is unchecked
-            "use_arrays": True      # Always use arrays for multi-valued properties
-        }
-    }
-    
     # Transform
-    config = TransformationConfig(config_dict)
+    config = TransformationConfig(CONFIG_DICT)
     engine = TransformationEngine(config)
     result = engine.transform(ontology)
     
-    # Print result
-    print("\n" + "=" * 80)
-    print("Transformation Result")
-    print("=" * 80)
-    print(json.dumps(result, indent=2))
+    # Print result only on request; the full schema is large
+    if os.getenv("TEST_DUMP_SCHEMA"):
+        print("\n" + "=" * 80)
+        print("Transformation Result")
+        print("=" * 80)
+        json.dump(result, sys.stdout, indent=2)
+        print()
     
     # Check for partOf property
     print("\n" + "=" * 80)
@@ -98,25 +109,13 @@ def test_with_gui_defaults():
     
     definitions = result.get('definitions', {})
     
-    # Check each class for partOf
-    found_partof = False
-    for class_name, class_def in definitions.items():
-        # Check direct properties
-        if 'properties' in class_def:
-            if 'partOf' in class_def['properties']:
-                print(f"✓ Found 'partOf' in {class_name} (direct properties)")
-                print(f"  Definition: {json.dumps(class_def['properties']['partOf'], indent=4)}")
-                found_partof = True
-        
-        # Check properties inside allOf structures
-        if 'allOf' in class_def:
-            for i, allof_item in enumerate(class_def['allOf']):
-                if 'properties' in allof_item and 'partOf' in allof_item['properties']:
-                    print(f"✓ Found 'partOf' in {class_name} (allOf[{i}].properties)")
-                    print(f"  Definition: {json.dumps(allof_item['properties']['partOf'], indent=4)}")
-                    found_partof = True
-    
-    if not found_partof:
+    # Stop at the first class that declares partOf
+    hit = next(find_property(definitions, 'partOf'), None)
+    if hit:
+        class_name, location, prop_schema = hit
+        print(f"✓ Found 'partOf' in {class_name} ({location})")
+        print(f"  Definition: {json.dumps(prop_schema, indent=4)}")
+    else:
         print("✗ 'partOf' not found in any class")
         print("\nChecking all properties in all classes:")
         for class_name, class_def in definitions.items():
@@ -135,4 +134,4 @@ def test_with_gui_defaults():
     return result
 
 if __name__ == "__main__":
-    test_with_gui_defaults()
\ No newline at end of file
+    test_with_gui_defaults(load(TEST_ONTOLOGY))
\ No newline at end of file
@@ -4,26 +4,17 @@ Test script to verify that properties are optional by default
 unless there's an explicit minimum cardinality constraint.
 """
 
-import json
 from pathlib import Path
-from owl2jsonschema import TransformationEngine, TransformationConfig, OntologyParser
+from owl2jsonschema import TransformationEngine, TransformationConfig
+from tests._fixtures import TEST_ONTOLOGY, collect, load, write_json
 
-def test_property_requirements():
+def test_property_requirements(railway_ontology):
     """Test that properties are handled correctly as optional/required."""
     
-    # Test with the main test ontology
-    test_file = Path("Documentation/test ontology for OWL to JSON schema transformation.ttl")
-    
-    if not test_file.exists():
-        print(f"Test file not found: {test_file}")
-        return
-    
-    print(f"Testing with: {test_file}")
+    print(f"Testing with: {TEST_ONTOLOGY}")
     print("=" * 80)
     
-    # Parse the ontology
-    parser = OntologyParser()
-    ontology = parser.parse(str(test_file))
+    ontology = railway_ontology
     
     print(f"Parsed ontology:")
     print(f"  - Classes: {len(ontology.classes)}")
@@ -43,37 +34,11 @@ def test_property_requirements():
     print("-" * 80)
     
     definitions = schema.get("definitions", {})
+    index = {name: collect(class_schema) for name, class_schema in definitions.items()}
     
-    for class_name, class_schema in definitions.items():
+    for class_name, (properties, required_props) in index.items():
         print(f"\nClass: {class_name}")
         
-        # Handle both direct properties and properties in allOf structures
-        properties = {}
-        required_props = []
-        
-        # Check direct properties
-        if "properties" in class_schema:
-            properties.update(class_schema["properties"])
-        if "required" in class_schema:
-            required_props.extend(class_schema["required"])
-        
-        # Check properties in allOf structures
-        if "allOf" in class_schema:
-            for item in class_schema["allOf"]:
-                if isinstance(item, dict):
-                    if "properties" in item:
-                        properties.update(item["properties"])
-                    if "required" in item:
-                        required_props.extend(item["required"])
-                    # Check nested allOf (for inherited properties)
-                    if "allOf" in item:
-                        for nested_item in item["allOf"]:
-                            if isinstance(nested_item, dict):
-                                if "properties" in nested_item:
-                                    properties.update(nested_item["properties"])
-                                if "required" in nested_item:
-                                    required_props.extend(nested_item["required"])
-        
         if properties:
             print(f"  Properties:")
             for prop_name, prop_schema in properties.items():
@@ -103,8 +68,7 @@ def test_property_requirements():
     output_file = Path("test_output/property_requirements_schema.json")
     output_file.parent.mkdir(exist_ok=True)
     
-    with open(output_file, 'w') as f:
-        json.dump(schema, f, indent=2)
+    write_json(output_file, schema)
     
     print(f"\n\nJSON Schema saved to: {output_file}")
     
@@ -114,7 +78,7 @@ def test_property_requirements():
     print("-" * 80)
     
     total_classes = len(definitions)
-    classes_with_required = sum(1 for d in definitions.values() if "required" in d and d["required"])
+    classes_with_required = sum(1 for d in definitions.values() if d.get("required"))
     
     print(f"Total classes: {total_classes}")
     print(f"Classes with required properties: {classes_with_required}")
@@ -125,14 +89,7 @@ def test_property_requirements():
     # Vehicle should have ofType as required (due to someValuesFrom restriction)
     vehicle_schema = definitions.get("Vehicle", {})
     
-    # Gather required properties from Vehicle schema (checking allOf structure)
-    vehicle_required = []
-    if "required" in vehicle_schema:
-        vehicle_required.extend(vehicle_schema["required"])
-    if "allOf" in vehicle_schema:
-        for item in vehicle_schema["allOf"]:
-            if isinstance(item, dict) and "required" in item:
-                vehicle_required.extend(item["required"])
+    vehicle_required = index.get("Vehicle", ({}, {}))[1]
     
     if "ofType" in vehicle_required:
         print("✓ Vehicle.ofType is correctly marked as REQUIRED (due to someValuesFrom)")
@@ -140,26 +97,7 @@ def test_property_requirements():
         print("✗ Vehicle.ofType should be REQUIRED but is not")
     
     # Other properties without cardinality restrictions should be optional
-    for class_name, class_schema in definitions.items():
-        # Gather all properties and required fields from the class schema
-        properties = {}
-        required_props = []
-        
-        # Check direct properties
-        if "properties" in class_schema:
-            properties.update(class_schema["properties"])
-        if "required" in class_schema:
-            required_props.extend(class_schema["required"])
-        
-        # Check properties in allOf structures
-        if "allOf" in class_schema:
-            for item in class_schema["allOf"]:
-                if isinstance(item, dict):
-                    if "properties" in item:
-                        properties.update(item["properties"])
-                    if "required" in item:
-                        required_props.extend(item["required"])
-        
+    for class_name, (properties, required_props) in index.items():
         for prop_name in properties:
             if prop_name in required_props:
                 # Check if this is expected
@@ -167,4 +105,4 @@ def test_property_requirements():
                     print(f"⚠ {class_name}.{prop_name} is REQUIRED - verify this is intentional")
 
 if __name__ == "__main__":
-    test_property_requirements()
\ No newline at end of file
+    test_property_requirements(load(TEST_ONTOLOGY))
\ No newline at end of file
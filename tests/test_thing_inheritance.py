@@ -3,16 +3,14 @@
 Test script for the base object inheritance feature with ThingWithUriRule.
 """
 
+import functools
 import json
 from owl2jsonschema.parser import OntologyParser
 from owl2jsonschema.engine import TransformationEngine
 from owl2jsonschema.config import TransformationConfig
 
-def test_thing_inheritance():
-    """Test the ThingWithUriRule base object inheritance."""
-    
-    # Sample OWL content
-    owl_content = """<?xml version="1.0"?>
+# Sample OWL content
+OWL_CONTENT = """<?xml version="1.0"?>
 <rdf:RDF xmlns="http://example.org/test#"
          xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
          xmlns:owl="http://www.w3.org/2002/07/owl#"
@@ -33,10 +31,19 @@ def test_thing_inheritance():
         <rdfs:range rdf:resource="http://www.w3.org/2001/XMLSchema#string"/>
     </owl:DatatypeProperty>
 </rdf:RDF>"""
+
+
+@functools.lru_cache(maxsize=None)
+def _parse(content):
+    """Parse OWL content once per process."""
+    return OntologyParser().parse_string(content)
+
+
+def test_thing_inheritance():
+    """Test the ThingWithUriRule base object inheritance."""
     
     # Parse OWL
-    parser = OntologyParser()
-    ontology = parser.parse_string(owl_content)
+    ontology = _parse(OWL_CONTENT)
     
     # Test 1: With ThingWithUriRule disabled
     config = TransformationConfig()
@@ -61,8 +68,8 @@ def test_thing_inheritance():
     print("\n✓ No base object inheritance when disabled")
     
     # Test 2: With ThingWithUriRule enabled
-    config.enable_rule("thing_with_uri")
-    engine = TransformationEngine(config)
+    # Reuse the engine; transform() resets the builder and every rule
+    engine.get_rule("thing_with_uri").enable()
     schema_with_thing = engine.transform(ontology)
     
     print("\n" + "=" * 60)
@@ -78,13 +85,13 @@ def test_thing_inheritance():
     assert "properties" in thing_def, "_Thing should have properties"
     assert "uri" in thing_def["properties"], "_Thing should have uri property"
     
-    # Verify other classes inherit from _Thing
-    for class_name, class_def in schema_with_thing.get("definitions", {}).items():
-        if class_name != "_Thing":
-            assert "allOf" in class_def, f"Class {class_name} should inherit from _Thing using allOf"
-            # Check that the first element references _Thing
-            assert class_def["allOf"][0] == {"$ref": "#/definitions/_Thing"}, \
-                f"Class {class_name} should reference _Thing as first allOf element"
+    # Verify other classes inherit from _Thing, referencing it as the first allOf element
+    thing_ref = {"$ref": "#/definitions/_Thing"}
+    non_thing = {k: v for k, v in schema_with_thing.get("definitions", {}).items() if k != "_Thing"}
+    missing = [k for k, v in non_thing.items() if "allOf" not in v]
+    assert not missing, f"Classes should inherit from _Thing using allOf: {missing}"
+    bad = [k for k, v in non_thing.items() if not v["allOf"] or v["allOf"][0] != thing_ref]
+    assert not bad, f"Classes should reference _Thing as first allOf element: {bad}"
     
     print("\n✓ Base object inheritance correctly applied when enabled")
     print("\n✓ All tests passed!")